@@ -126,6 +126,9 @@ class RedFlag(BaseModel):
     severity: RedFlagSeverity = Field(..., description="Severity level")
     description: str = Field(..., description="Human-readable description")
 
+    class Config:
+        frozen = True
+
 
 class InternshipListingBase(BaseModel):
     """Base model for internship listing data"""
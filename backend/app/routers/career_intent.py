@@ -6,6 +6,7 @@ from ai.context_aware_resume_ai import get_context_aware_resume_ai
 from utils.pdf_parser import get_document_parser
 from utils.response_formatter import get_response_formatter
 from typing import Optional
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -171,10 +172,10 @@ async def upload_resume_with_intent(
                 detail=f"Unsupported file type. Allowed: {', '.join(allowed_extensions)}"
             )
         
-        # Read and extract text
+        # Read and extract text (parsing runs off the event loop)
         content = await file.read()
         parser = get_document_parser()
-        text_content = parser.extract_text(content, file.filename)
+        text_content = await asyncio.to_thread(parser.extract_text, content, file.filename)
         
         if not text_content or len(text_content) < 50:
             raise HTTPException(
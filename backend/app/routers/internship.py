@@ -33,7 +33,7 @@ from app.services.internship_service_mongo import (
 from core.security import get_current_user
 from core.config import get_settings
 from utils.response_formatter import get_response_formatter
-from core.database import get_database
+from core.database import get_database, get_supabase_client
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -513,6 +513,7 @@ async def verify_internship(
         
         # Get internship details
         try:
+            supabase = get_supabase_client()
             internship_result = supabase.table('internship_listings').select('*').eq('id', internship_id).execute()
             if not internship_result.data:
                 raise HTTPException(
@@ -666,6 +667,7 @@ async def calculate_skill_match(
         
         # Get internship details
         try:
+            supabase = get_supabase_client()
             internship_result = supabase.table('internship_listings').select('*').eq('id', internship_id).execute()
             if not internship_result.data:
                 raise HTTPException(
@@ -812,6 +814,7 @@ async def get_career_guidance(
         
         # Get internship details
         try:
+            supabase = get_supabase_client()
             internship_result = supabase.table('internship_listings').select('*').eq('id', internship_id).execute()
             if not internship_result.data:
                 raise HTTPException(
@@ -6,6 +6,7 @@ from utils.response_formatter import get_response_formatter
 from services.youtube_service import get_youtube_service
 from services.google_service import get_google_service
 from typing import Optional
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -43,9 +44,9 @@ async def upload_resume(
         # Read file content
         content = await file.read()
         
-        # Extract text
+        # Extract text off the event loop; parsing is CPU-bound
         parser = get_document_parser()
-        text_content = parser.extract_text(content, file.filename)
+        text_content = await asyncio.to_thread(parser.extract_text, content, file.filename)
         
         if not text_content or len(text_content) < 50:
             raise HTTPException(
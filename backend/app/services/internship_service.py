@@ -5,7 +5,7 @@ This service handles student profile management, internship search, verification
 skill matching, readiness scoring, and career guidance.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Callable
 from datetime import datetime
 import uuid
 import logging
@@ -21,6 +21,29 @@ from app.models.internship import (
 logger = logging.getLogger(__name__)
 
 
+# (predicate, message) pairs checked in order by _validate_profile_data; the
+# first predicate that holds rejects the profile. Predicates take the profile
+# and the current year, and cheap scalar checks run before list lengths.
+_PROFILE_CHECKS: Tuple[Tuple[Callable[[StudentProfileCreate, int], bool], str], ...] = (
+    (lambda p, year: p.graduation_year < year,
+     "Graduation year must be {year} or later"),
+    (lambda p, year: p.graduation_year > year + 10,
+     "Graduation year cannot be more than 10 years in the future"),
+    (lambda p, year: not (1 <= p.current_semester <= 8),
+     "Current semester must be between 1 and 8"),
+    (lambda p, year: not p.degree or not p.degree.strip(),
+     "Degree is required"),
+    (lambda p, year: not p.branch or not p.branch.strip(),
+     "Branch is required"),
+    (lambda p, year: len(p.skills or ()) > 50,
+     "Maximum 50 skills allowed"),
+    (lambda p, year: len(p.preferred_roles or ()) > 20,
+     "Maximum 20 preferred roles allowed"),
+    (lambda p, year: len(p.target_companies or ()) > 30,
+     "Maximum 30 target companies allowed"),
+)
+
+
 class ProfileValidationError(Exception):
     """Custom exception for profile validation errors"""
     pass
@@ -49,6 +72,39 @@ class InternshipService:
         self.db = supabase_client
         logger.info("InternshipService initialized")
     
+    @staticmethod
+    def _clean_string_list(items: List[str]) -> List[str]:
+        """
+        Strip entries and drop blanks and case-insensitive duplicates in one pass
+        
+        The first spelling of each entry is kept and order is preserved.
+        """
+        seen = set()
+        cleaned = []
+        for item in items:
+            item = item.strip()
+            if not item:
+                continue
+            key = item.casefold()
+            if key in seen:
+                continue
+            seen.add(key)
+            cleaned.append(item)
+        return cleaned
+    
+    @staticmethod
+    def _to_row(user_id: str, profile_data: StudentProfileCreate) -> Dict[str, Any]:
+        """Convert validated profile data to a student_profiles row"""
+        profile_dict = profile_data.model_dump()
+        profile_dict['user_id'] = user_id
+        
+        # Convert enum values to strings if needed
+        if profile_data.internship_type:
+            profile_dict['internship_type'] = profile_data.internship_type.value
+        if profile_data.compensation_preference:
+            profile_dict['compensation_preference'] = profile_data.compensation_preference.value
+        return profile_dict
+    
     def _validate_profile_data(self, profile_data: StudentProfileCreate) -> None:
         """
         Validate profile data before database operations
@@ -59,55 +115,21 @@ class InternshipService:
         Raises:
             ProfileValidationError: If validation fails
         """
-        # Validate graduation year
         current_year = datetime.now().year
-        if profile_data.graduation_year < current_year:
-            raise ProfileValidationError(
-                f"Graduation year must be {current_year} or later"
-            )
-        
-        if profile_data.graduation_year > current_year + 10:
-            raise ProfileValidationError(
-                f"Graduation year cannot be more than 10 years in the future"
-            )
-        
-        # Validate semester
-        if not (1 <= profile_data.current_semester <= 8):
-            raise ProfileValidationError(
-                "Current semester must be between 1 and 8"
-            )
+        message = next(
+            (msg for check, msg in _PROFILE_CHECKS if check(profile_data, current_year)),
+            None
+        )
+        if message is not None:
+            raise ProfileValidationError(message.format(year=current_year))
         
-        # Validate degree and branch
-        if not profile_data.degree or not profile_data.degree.strip():
-            raise ProfileValidationError("Degree is required")
-        
-        if not profile_data.branch or not profile_data.branch.strip():
-            raise ProfileValidationError("Branch is required")
-        
-        # Validate skills list
+        # Remove empty strings and duplicates
         if profile_data.skills:
-            if len(profile_data.skills) > 50:
-                raise ProfileValidationError(
-                    "Maximum 50 skills allowed"
-                )
-            # Remove empty strings and duplicates
-            profile_data.skills = list(set([s.strip() for s in profile_data.skills if s.strip()]))
-        
-        # Validate preferred roles
+            profile_data.skills = self._clean_string_list(profile_data.skills)
         if profile_data.preferred_roles:
-            if len(profile_data.preferred_roles) > 20:
-                raise ProfileValidationError(
-                    "Maximum 20 preferred roles allowed"
-                )
-            profile_data.preferred_roles = list(set([r.strip() for r in profile_data.preferred_roles if r.strip()]))
-        
-        # Validate target companies
+            profile_data.preferred_roles = self._clean_string_list(profile_data.preferred_roles)
         if profile_data.target_companies:
-            if len(profile_data.target_companies) > 30:
-                raise ProfileValidationError(
-                    "Maximum 30 target companies allowed"
-                )
-            profile_data.target_companies = list(set([c.strip() for c in profile_data.target_companies if c.strip()]))
+            profile_data.target_companies = self._clean_string_list(profile_data.target_companies)
         
         logger.debug(f"Profile data validation passed for semester {profile_data.current_semester}")
     
@@ -132,15 +154,7 @@ class InternshipService:
             # Validate profile data
             self._validate_profile_data(profile_data)
             
-            # Convert Pydantic model to dict
-            profile_dict = profile_data.model_dump()
-            profile_dict['user_id'] = user_id
-            
-            # Convert enum values to strings if needed
-            if profile_data.internship_type:
-                profile_dict['internship_type'] = profile_data.internship_type.value
-            if profile_data.compensation_preference:
-                profile_dict['compensation_preference'] = profile_data.compensation_preference.value
+            profile_dict = self._to_row(user_id, profile_data)
             
             # Check if profile already exists
             existing = self.db.table('student_profiles').select('*').eq('user_id', user_id).execute()
@@ -202,6 +216,78 @@ class InternshipService:
             logger.error(f"Unexpected error retrieving profile for user {user_id}: {e}")
             raise DatabaseOperationError(f"Failed to retrieve profile: {str(e)}")
     
+    async def get_profiles(self, user_ids: List[str]) -> Dict[str, StudentProfile]:
+        """
+        Retrieve several student profiles with a single query
+        
+        Args:
+            user_ids: User IDs to look up
+            
+        Returns:
+            Mapping of user_id to profile for the users that have one
+            
+        Raises:
+            DatabaseOperationError: If database operation fails
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return {}
+        
+        try:
+            logger.info(f"Retrieving {len(user_ids)} profiles")
+            
+            result = self.db.table('student_profiles').select('*').in_('user_id', user_ids).execute()
+            
+            profiles = (StudentProfile(**row) for row in result.data or [])
+            return {profile.user_id: profile for profile in profiles}
+            
+        except APIError as e:
+            logger.error(f"Supabase API error retrieving {len(user_ids)} profiles: {e}")
+            raise DatabaseOperationError(f"Failed to retrieve profiles: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error retrieving {len(user_ids)} profiles: {e}")
+            raise DatabaseOperationError(f"Failed to retrieve profiles: {str(e)}")
+    
+    async def upsert_profiles(self, profiles: Dict[str, StudentProfileCreate]) -> List[StudentProfile]:
+        """
+        Create or update several student profiles with a single query
+        
+        Every profile is validated before anything is written.
+        
+        Args:
+            profiles: Mapping of user_id to profile data
+            
+        Returns:
+            Created/updated student profiles
+            
+        Raises:
+            ProfileValidationError: If any profile fails validation
+            DatabaseOperationError: If database operation fails
+        """
+        try:
+            rows = []
+            for user_id, profile_data in profiles.items():
+                self._validate_profile_data(profile_data)
+                rows.append(self._to_row(user_id, profile_data))
+            
+            if not rows:
+                return []
+            
+            logger.info(f"Upserting {len(rows)} profiles")
+            result = self.db.table('student_profiles').upsert(rows, on_conflict='user_id').execute()
+            
+            return [StudentProfile(**row) for row in result.data or []]
+            
+        except ProfileValidationError:
+            logger.warning("Profile validation failed during bulk upsert")
+            raise
+        except APIError as e:
+            logger.error(f"Supabase API error upserting {len(profiles)} profiles: {e}")
+            raise DatabaseOperationError(f"Failed to upsert profiles: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error upserting {len(profiles)} profiles: {e}")
+            raise DatabaseOperationError(f"Failed to upsert profiles: {str(e)}")
+    
     async def update_profile(self, user_id: str, profile_data: StudentProfileUpdate) -> StudentProfile:
         """
         Update existing student profile with validation
@@ -256,19 +342,19 @@ class InternshipService:
             if 'skills' in update_dict and update_dict['skills']:
                 if len(update_dict['skills']) > 50:
                     raise ProfileValidationError("Maximum 50 skills allowed")
-                update_dict['skills'] = list(set([s.strip() for s in update_dict['skills'] if s.strip()]))
+                update_dict['skills'] = self._clean_string_list(update_dict['skills'])
             
             # Validate and clean preferred roles
             if 'preferred_roles' in update_dict and update_dict['preferred_roles']:
                 if len(update_dict['preferred_roles']) > 20:
                     raise ProfileValidationError("Maximum 20 preferred roles allowed")
-                update_dict['preferred_roles'] = list(set([r.strip() for r in update_dict['preferred_roles'] if r.strip()]))
+                update_dict['preferred_roles'] = self._clean_string_list(update_dict['preferred_roles'])
             
             # Validate and clean target companies
             if 'target_companies' in update_dict and update_dict['target_companies']:
                 if len(update_dict['target_companies']) > 30:
                     raise ProfileValidationError("Maximum 30 target companies allowed")
-                update_dict['target_companies'] = list(set([c.strip() for c in update_dict['target_companies'] if c.strip()]))
+                update_dict['target_companies'] = self._clean_string_list(update_dict['target_companies'])
             
             # Convert enum values to strings if needed
             if 'internship_type' in update_dict and update_dict['internship_type']:
@@ -5,8 +5,12 @@ This service handles skill matching calculations, learning path generation,
 and internship ranking based on relevance to user profiles.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple, TypedDict
+from functools import lru_cache
+from itertools import chain
 import logging
+import sys
+import unicodedata
 from datetime import datetime
 
 from app.models.internship import (
@@ -20,6 +24,25 @@ from app.models.internship import (
 logger = logging.getLogger(__name__)
 
 
+class SkillMatchResult(TypedDict):
+    """Result of calculate_skill_match; a plain dict so callers index it by key"""
+    match_percentage: int
+    matching_skills: List[str]
+    missing_skills: List[str]
+
+
+@lru_cache(maxsize=4096)
+def _norm_skill(skill: str) -> str:
+    """
+    Normalize a skill name for comparison (NFKC, casefolded, trimmed)
+    
+    The result is interned, so every spelling of a skill ("Python", "PYTHON")
+    maps to one canonical string object that set and dict lookups compare by
+    identity first.
+    """
+    return sys.intern(unicodedata.normalize("NFKC", skill).casefold().strip())
+
+
 class MatchingService:
     """Skill matching and recommendation engine"""
     
@@ -201,14 +224,24 @@ class MatchingService:
         "distributed systems": "hard",
     }
     
-    def __init__(self, db_client=None):
+    # Percentage weights of required and preferred skills in the match score
+    REQUIRED_WEIGHT = 70
+    PREFERRED_WEIGHT = 30
+    
+    # Upper bound on memoized skill-match results per instance
+    MATCH_CACHE_MAX_SIZE = 256
+    
+    def __init__(self, db_client=None, cache_matches: bool = False):
         """
         Initialize the matching service
         
         Args:
             db_client: Optional database client for caching results
+            cache_matches: Memoize calculate_skill_match results by input skills
         """
         self.db = db_client
+        self.cache_matches = cache_matches
+        self._match_cache: Dict[Tuple[Tuple[str, ...], ...], SkillMatchResult] = {}
         logger.info("MatchingService initialized")
     
     def _normalize_skill(self, skill: str) -> str:
@@ -219,9 +252,9 @@ class MatchingService:
             skill: Raw skill name
             
         Returns:
-            Normalized skill name (lowercase, trimmed)
+            Normalized skill name (NFKC, casefolded, trimmed)
         """
-        return skill.lower().strip()
+        return _norm_skill(skill)
     
     def _get_skill_difficulty(self, skill: str) -> str:
         """
@@ -247,38 +280,53 @@ class MatchingService:
             List of learning resource URLs/names
         """
         normalized_skill = self._normalize_skill(skill)
+        return self.LEARNING_RESOURCES[self._resource_key(normalized_skill)]
+    
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _resource_key(cls, normalized_skill: str) -> str:
+        """
+        Resolve a normalized skill to its LEARNING_RESOURCES key
         
+        Memoized, so the partial-match scan over LEARNING_RESOURCES runs once
+        per distinct skill rather than on every lookup.
+        
+        Args:
+            normalized_skill: Normalized skill name
+            
+        Returns:
+            Matching key, or "default" if none matches
+        """
         # Try exact match first
-        if normalized_skill in self.LEARNING_RESOURCES:
-            return self.LEARNING_RESOURCES[normalized_skill]
+        if normalized_skill in cls.LEARNING_RESOURCES:
+            return normalized_skill
         
         # Try partial match (e.g., "react.js" matches "react")
         # Only match if the key is a substring of the skill or vice versa
         # and the match is substantial (at least 3 characters)
-        for key in self.LEARNING_RESOURCES:
+        for key in cls.LEARNING_RESOURCES:
             if len(key) >= 3:  # Only consider keys with at least 3 characters
                 if key in normalized_skill or normalized_skill in key:
                     # Ensure it's a substantial match (at least 50% of the shorter string)
                     shorter_len = min(len(key), len(normalized_skill))
                     if shorter_len >= 3:  # Minimum 3 character match
-                        return self.LEARNING_RESOURCES[key]
+                        return key
         
-        # Return default resources
-        return self.LEARNING_RESOURCES["default"]
+        # Fall back to default resources
+        return "default"
     
-    def _prioritize_skill(self, skill: str, required_skills: List[str]) -> str:
+    def _prioritize_skill(self, skill: str, normalized_required: Set[str]) -> str:
         """
         Determine priority level for learning a skill
         
         Args:
             skill: Skill to prioritize
-            required_skills: List of required skills for the internship
+            normalized_required: Required skills for the internship, already normalized
             
         Returns:
             Priority level: "High", "Medium", or "Low"
         """
         normalized_skill = self._normalize_skill(skill)
-        normalized_required = [self._normalize_skill(s) for s in required_skills]
         
         # High priority if it's a required skill
         if normalized_skill in normalized_required:
@@ -292,12 +340,48 @@ class MatchingService:
         user_skills: List[str],
         required_skills: List[str],
         preferred_skills: Optional[List[str]] = None
-    ) -> Dict[str, Any]:
+    ) -> SkillMatchResult:
+        """
+        Calculate skill match percentage (async wrapper around calculate_skill_match_sync)
+        
+        Args:
+            user_skills: List of user's skills
+            required_skills: List of required skills for internship
+            preferred_skills: Optional list of preferred skills
+            
+        Returns:
+            Dictionary with match_percentage, matching_skills and missing_skills
+        """
+        if not self.cache_matches:
+            return self.calculate_skill_match_sync(user_skills, required_skills, preferred_skills)
+        
+        # Skill order decides the order of the returned lists, so key on tuples
+        key = (tuple(user_skills), tuple(required_skills), tuple(preferred_skills or ()))
+        result = self._match_cache.get(key)
+        if result is None:
+            result = self.calculate_skill_match_sync(user_skills, required_skills, preferred_skills)
+            if len(self._match_cache) >= self.MATCH_CACHE_MAX_SIZE:
+                del self._match_cache[next(iter(self._match_cache))]
+            self._match_cache[key] = result
+        
+        # Hand out fresh lists so callers cannot mutate the cached entry
+        return {
+            "match_percentage": result["match_percentage"],
+            "matching_skills": list(result["matching_skills"]),
+            "missing_skills": list(result["missing_skills"])
+        }
+    
+    def calculate_skill_match_sync(
+        self,
+        user_skills: List[str],
+        required_skills: List[str],
+        preferred_skills: Optional[List[str]] = None
+    ) -> SkillMatchResult:
         """
         Calculate skill match percentage between user skills and internship requirements
         
         Algorithm:
-        1. Normalize all skills (lowercase, trim)
+        1. Normalize all skills (NFKC, casefold, trim)
         2. Calculate intersection (matching skills)
         3. Calculate difference (missing required skills)
         4. Calculate match percentage:
@@ -313,8 +397,8 @@ class MatchingService:
         Returns:
             Dictionary with:
             - match_percentage: int (0-100)
-            - matching_skills: List[str]
-            - missing_skills: List[str]
+            - matching_skills: List[str], in input order
+            - missing_skills: List[str], in required_skills order
         """
         logger.info(f"Calculating skill match for {len(user_skills)} user skills vs {len(required_skills)} required skills")
         
@@ -332,35 +416,38 @@ class MatchingService:
             return {
                 "match_percentage": 0,
                 "matching_skills": [],
-                "missing_skills": required_skills
+                "missing_skills": list(required_skills)
             }
         
-        # Normalize skills
-        user_skills_normalized = set(self._normalize_skill(s) for s in user_skills)
-        required_skills_normalized = set(self._normalize_skill(s) for s in required_skills)
-        preferred_skills_normalized = set(self._normalize_skill(s) for s in (preferred_skills or []))
+        # Normalize each skill once, keeping the original spelling alongside
+        normalize = self._normalize_skill
+        required_pairs = [(skill, normalize(skill)) for skill in required_skills]
+        preferred_pairs = [(skill, normalize(skill)) for skill in (preferred_skills or [])]
+        user_skills_normalized = set(map(normalize, user_skills))
+        required_skills_normalized = {normalized for _, normalized in required_pairs}
+        preferred_skills_normalized = {normalized for _, normalized in preferred_pairs}
         
         # Calculate matching and missing skills for required
         matching_required = user_skills_normalized.intersection(required_skills_normalized)
         missing_required = required_skills_normalized.difference(user_skills_normalized)
         
-        # Calculate required skills match percentage
-        required_match_pct = (len(matching_required) / len(required_skills_normalized)) * 100
-        
         # Calculate preferred skills match if provided
-        preferred_match_pct = 0
         matching_preferred = set()
         if preferred_skills_normalized:
             matching_preferred = user_skills_normalized.intersection(preferred_skills_normalized)
-            preferred_match_pct = (len(matching_preferred) / len(preferred_skills_normalized)) * 100
         
-        # Calculate weighted match percentage
+        # Calculate weighted match percentage in integers so the floor is exact
         # Required: 70% weight, Preferred: 30% weight
+        total_required = len(required_skills_normalized)
         if preferred_skills_normalized:
-            match_percentage = int((required_match_pct * 0.7) + (preferred_match_pct * 0.3))
+            total_preferred = len(preferred_skills_normalized)
+            match_percentage = (
+                self.REQUIRED_WEIGHT * len(matching_required) * total_preferred
+                + self.PREFERRED_WEIGHT * len(matching_preferred) * total_required
+            ) // (total_required * total_preferred)
         else:
             # If no preferred skills, use only required skills
-            match_percentage = int(required_match_pct)
+            match_percentage = len(matching_required) * 100 // total_required
         
         # Ensure percentage is within bounds [0, 100]
         match_percentage = max(0, min(100, match_percentage))
@@ -368,14 +455,14 @@ class MatchingService:
         # Get original case for matching skills
         all_matching = matching_required.union(matching_preferred)
         matching_skills_original = [
-            skill for skill in (required_skills + (preferred_skills or []))
-            if self._normalize_skill(skill) in all_matching
+            skill for skill, normalized in chain(required_pairs, preferred_pairs)
+            if normalized in all_matching
         ]
         
         # Get original case for missing skills
         missing_skills_original = [
-            skill for skill in required_skills
-            if self._normalize_skill(skill) in missing_required
+            skill for skill, normalized in required_pairs
+            if normalized in missing_required
         ]
         
         logger.info(f"Match calculation complete: {match_percentage}% ({len(matching_skills_original)} matching, {len(missing_skills_original)} missing)")
@@ -390,6 +477,23 @@ class MatchingService:
         self,
         missing_skills: List[str],
         required_skills: Optional[List[str]] = None
+    ) -> List[LearningPathItem]:
+        """
+        Generate learning path (async wrapper around generate_learning_path_sync)
+        
+        Args:
+            missing_skills: List of skills the user needs to learn
+            required_skills: Optional list of required skills (for prioritization)
+            
+        Returns:
+            List of LearningPathItem objects
+        """
+        return self.generate_learning_path_sync(missing_skills, required_skills)
+    
+    def generate_learning_path_sync(
+        self,
+        missing_skills: List[str],
+        required_skills: Optional[List[str]] = None
     ) -> List[LearningPathItem]:
         """
         Generate learning path for missing skills
@@ -415,7 +519,7 @@ class MatchingService:
             return []
         
         learning_path = []
-        required_skills = required_skills or []
+        normalized_required = set(map(self._normalize_skill, required_skills or []))
         
         for skill in missing_skills:
             # Determine difficulty and time
@@ -426,7 +530,7 @@ class MatchingService:
             resources = self._get_learning_resources(skill)
             
             # Determine priority
-            priority = self._prioritize_skill(skill, required_skills)
+            priority = self._prioritize_skill(skill, normalized_required)
             
             # Create learning path item
             item = LearningPathItem(
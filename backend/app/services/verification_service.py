@@ -6,7 +6,8 @@ including domain authenticity checks, platform legitimacy verification,
 red flag detection, and trust score calculation.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
 import re
 import logging
 from datetime import datetime
@@ -24,11 +25,47 @@ from app.models.internship import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _verification_notes(
+    official_domain: bool,
+    known_platform: bool,
+    company_verified: bool,
+    flag_descriptions: Tuple[str, ...],
+    status: VerificationStatus
+) -> str:
+    """Build verification notes; listings with the same signals, flags and status share one result"""
+    notes = []
+    
+    # Add positive signals
+    if official_domain:
+        notes.append("✓ Official company domain verified")
+    if known_platform:
+        notes.append("✓ Listed on known platform")
+    if company_verified:
+        notes.append("✓ Company verified on external sources")
+    
+    # Add red flag warnings
+    if flag_descriptions:
+        notes.append(f"\n⚠ {len(flag_descriptions)} red flag(s) detected:")
+        for description in flag_descriptions:
+            notes.append(f"  - {description}")
+    
+    # Add overall assessment
+    if status is VerificationStatus.VERIFIED:
+        notes.append("\n✅ This internship appears legitimate and safe to apply.")
+    elif status is VerificationStatus.USE_CAUTION:
+        notes.append("\n⚠️ Exercise caution. Verify details before applying.")
+    else:
+        notes.append("\n❌ High risk of fraud. Avoid this internship.")
+    
+    return "\n".join(notes)
+
+
 class VerificationService:
     """Fraud detection and verification logic"""
     
     # Known legitimate platforms
-    KNOWN_PLATFORMS = {
+    KNOWN_PLATFORMS = frozenset({
         "internshala",
         "linkedin",
         "wellfound",
@@ -39,17 +76,27 @@ class VerificationService:
         "naukri",
         "indeed",
         "glassdoor",
-    }
+    })
     
     # Non-official email domains (red flag)
-    NON_OFFICIAL_DOMAINS = {
+    NON_OFFICIAL_DOMAINS = frozenset({
         "gmail.com",
         "yahoo.com",
         "hotmail.com",
         "outlook.com",
         "rediffmail.com",
         "ymail.com",
-    }
+    })
+    
+    # Common TLDs ignored when matching domain labels against the company name
+    _DOMAIN_TLDS = frozenset({'com', 'org', 'net', 'edu', 'gov', 'co', 'in', 'io', 'ai'})
+    
+    # Company-name normalization, compiled once rather than on every check
+    _COMPANY_SUFFIX_PATTERN = re.compile(r'\s+(pvt\.?|ltd\.?|inc\.?|corp\.?|llc|limited|private)$')
+    _NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]')
+    
+    # Stipend amount with an optional "k" (thousands) suffix
+    _STIPEND_PATTERN = re.compile(r'₹?\s*(\d+(?:,\d+)*(?:\.\d+)?)\s*(k)?')
     
     # Keywords indicating registration fees
     REGISTRATION_FEE_KEYWORDS = [
@@ -86,6 +133,48 @@ class VerificationService:
         "multiple responsibilities",
     ]
     
+    # Red flags whose wording never varies; RedFlag is immutable, so one
+    # instance of each is shared by every listing that raises it
+    _REGISTRATION_FEE_FLAG = RedFlag(
+        type="registration_fee",
+        severity=RedFlagSeverity.HIGH,
+        description="Asks for registration or enrollment fee"
+    )
+    _WHATSAPP_ONLY_FLAG = RedFlag(
+        type="whatsapp_only",
+        severity=RedFlagSeverity.HIGH,
+        description="Uses WhatsApp as the only contact method"
+    )
+    _NON_OFFICIAL_EMAIL_FLAG = RedFlag(
+        type="non_official_email",
+        severity=RedFlagSeverity.HIGH,
+        description="Uses non-official email domain (Gmail, Yahoo, etc.)"
+    )
+    _VAGUE_DESCRIPTION_FLAG = RedFlag(
+        type="vague_description",
+        severity=RedFlagSeverity.MEDIUM,
+        description="Job responsibilities are vague or poorly defined"
+    )
+    _NO_RESPONSIBILITIES_FLAG = RedFlag(
+        type="vague_description",
+        severity=RedFlagSeverity.MEDIUM,
+        description="No job responsibilities specified"
+    )
+    
+    # The fee and WhatsApp keyword lists compiled into one alternation each, so a
+    # listing is scanned once per category rather than once per keyword
+    _REGISTRATION_FEE_PATTERN = re.compile("|".join(map(re.escape, REGISTRATION_FEE_KEYWORDS)))
+    _WHATSAPP_ONLY_PATTERN = re.compile("|".join(map(re.escape, WHATSAPP_ONLY_KEYWORDS)))
+    
+    # Verification status for every trust score 0-100:
+    # >= 80 Verified, 50-79 Use Caution, < 50 Potential Scam
+    _STATUS_BY_SCORE = tuple(
+        VerificationStatus.VERIFIED if score >= 80
+        else VerificationStatus.USE_CAUTION if score >= 50
+        else VerificationStatus.POTENTIAL_SCAM
+        for score in range(101)
+    )
+    
     def __init__(self, db_client=None):
         """
         Initialize the verification service
@@ -127,17 +216,16 @@ class VerificationService:
         # Check if domain contains company name (basic heuristic)
         company_normalized = company.lower().strip()
         # Remove common suffixes like "pvt ltd", "inc", "corp", etc.
-        company_normalized = re.sub(r'\s+(pvt\.?|ltd\.?|inc\.?|corp\.?|llc|limited|private)$', '', company_normalized)
-        company_normalized = re.sub(r'[^a-z0-9]', '', company_normalized)
+        company_normalized = self._COMPANY_SUFFIX_PATTERN.sub('', company_normalized)
+        company_normalized = self._NON_ALNUM_PATTERN.sub('', company_normalized)
         
         # Extract all parts of the domain (to handle subdomains like careers.techcorp.com)
         domain_parts = domain.split('.')
         
         # Check each part of the domain (excluding common TLDs)
-        tlds = {'com', 'org', 'net', 'edu', 'gov', 'co', 'in', 'io', 'ai'}
         for part in domain_parts:
-            if part not in tlds:
-                part_normalized = re.sub(r'[^a-z0-9]', '', part)
+            if part not in self._DOMAIN_TLDS:
+                part_normalized = self._NON_ALNUM_PATTERN.sub('', part)
                 # Check if company name is in domain part or vice versa
                 if company_normalized in part_normalized or part_normalized in company_normalized:
                     logger.debug(f"Domain {domain} matches company {company}")
@@ -197,49 +285,36 @@ class VerificationService:
         company = internship_dict.get('company', '').lower()
         stipend = internship_dict.get('stipend', '').lower()
         responsibilities = internship_dict.get('responsibilities', [])
+        responsibilities_text = ' '.join(responsibilities).lower()
         company_domain = internship_dict.get('company_domain', '')
         
-        # Combine text fields for keyword search
-        combined_text = f"{title} {company} {stipend} {' '.join(responsibilities)}".lower()
+        # Combine the already-lowercased text fields for keyword search
+        combined_text = f"{title} {company} {stipend} {responsibilities_text}"
         
         # 1. Check for registration fees
-        for keyword in self.REGISTRATION_FEE_KEYWORDS:
-            if keyword in combined_text:
-                red_flags.append(RedFlag(
-                    type="registration_fee",
-                    severity=RedFlagSeverity.HIGH,
-                    description="Asks for registration or enrollment fee"
-                ))
-                logger.warning(f"Registration fee red flag detected: {keyword}")
-                break
+        keyword_match = self._REGISTRATION_FEE_PATTERN.search(combined_text)
+        if keyword_match:
+            red_flags.append(self._REGISTRATION_FEE_FLAG)
+            logger.warning(f"Registration fee red flag detected: {keyword_match.group()}")
         
         # 2. Check for WhatsApp-only contact
-        for keyword in self.WHATSAPP_ONLY_KEYWORDS:
-            if keyword in combined_text:
-                red_flags.append(RedFlag(
-                    type="whatsapp_only",
-                    severity=RedFlagSeverity.HIGH,
-                    description="Uses WhatsApp as the only contact method"
-                ))
-                logger.warning(f"WhatsApp-only red flag detected: {keyword}")
-                break
+        keyword_match = self._WHATSAPP_ONLY_PATTERN.search(combined_text)
+        if keyword_match:
+            red_flags.append(self._WHATSAPP_ONLY_FLAG)
+            logger.warning(f"WhatsApp-only red flag detected: {keyword_match.group()}")
         
         # 3. Check for non-official email domain
         if company_domain and company_domain.lower() in self.NON_OFFICIAL_DOMAINS:
-            red_flags.append(RedFlag(
-                type="non_official_email",
-                severity=RedFlagSeverity.HIGH,
-                description="Uses non-official email domain (Gmail, Yahoo, etc.)"
-            ))
+            red_flags.append(self._NON_OFFICIAL_EMAIL_FLAG)
             logger.warning(f"Non-official email red flag detected: {company_domain}")
         
         # 4. Check for unrealistic stipend
         # Extract numeric value from stipend string
-        stipend_match = re.search(r'₹?\s*(\d+(?:,\d+)*(?:\.\d+)?)\s*k?', stipend)
+        stipend_match = self._STIPEND_PATTERN.search(stipend)
         if stipend_match:
             stipend_value = float(stipend_match.group(1).replace(',', ''))
-            # Check if 'k' is present (thousands)
-            if 'k' in stipend.lower():
+            # Scale by 1000 when the amount itself carries a 'k' suffix
+            if stipend_match.group(2):
                 stipend_value *= 1000
             
             # Flag if stipend is unrealistically high (>50,000 per month for freshers)
@@ -253,24 +328,15 @@ class VerificationService:
         
         # 5. Check for vague job descriptions
         if responsibilities:
-            responsibilities_text = ' '.join(responsibilities).lower()
             vague_count = sum(1 for keyword in self.VAGUE_DESCRIPTION_KEYWORDS if keyword in responsibilities_text)
             
             # If multiple vague keywords or very short responsibilities
             if vague_count >= 2 or (len(responsibilities) == 1 and len(responsibilities[0]) < 50):
-                red_flags.append(RedFlag(
-                    type="vague_description",
-                    severity=RedFlagSeverity.MEDIUM,
-                    description="Job responsibilities are vague or poorly defined"
-                ))
+                red_flags.append(self._VAGUE_DESCRIPTION_FLAG)
                 logger.warning("Vague description red flag detected")
         else:
             # No responsibilities listed at all
-            red_flags.append(RedFlag(
-                type="vague_description",
-                severity=RedFlagSeverity.MEDIUM,
-                description="No job responsibilities specified"
-            ))
+            red_flags.append(self._NO_RESPONSIBILITIES_FLAG)
             logger.warning("No responsibilities red flag detected")
         
         logger.info(f"Detected {len(red_flags)} red flags for internship")
@@ -336,6 +402,18 @@ class VerificationService:
         logger.info(f"Calculated trust score: {score}")
         return score
     
+    def determine_status(self, trust_score: int) -> VerificationStatus:
+        """
+        Map a trust score to its verification status
+        
+        Args:
+            trust_score: Trust score (clamped to 0-100)
+            
+        Returns:
+            Verified (>= 80), Use Caution (50-79) or Potential Scam (< 50)
+        """
+        return self._STATUS_BY_SCORE[max(0, min(100, trust_score))]
+    
     async def verify_internship(self, internship: InternshipListing) -> VerificationResult:
         """
         Comprehensive verification of internship listing
@@ -376,12 +454,7 @@ class VerificationService:
         trust_score = self.calculate_trust_score(signals, red_flags)
         
         # Determine verification status based on trust score
-        if trust_score >= 80:
-            status = VerificationStatus.VERIFIED
-        elif trust_score >= 50:
-            status = VerificationStatus.USE_CAUTION
-        else:
-            status = VerificationStatus.POTENTIAL_SCAM
+        status = self.determine_status(trust_score)
         
         logger.info(f"Verification complete: {status.value} (trust score: {trust_score})")
         
@@ -417,28 +490,11 @@ class VerificationService:
         Returns:
             Verification notes string
         """
-        notes = []
-        
-        # Add positive signals
-        if signals.official_domain:
-            notes.append("✓ Official company domain verified")
-        if signals.known_platform:
-            notes.append("✓ Listed on known platform")
-        if signals.company_verified:
-            notes.append("✓ Company verified on external sources")
-        
-        # Add red flag warnings
-        if red_flags:
-            notes.append(f"\n⚠ {len(red_flags)} red flag(s) detected:")
-            for flag in red_flags:
-                notes.append(f"  - {flag.description}")
-        
-        # Add overall assessment
-        if trust_score >= 80:
-            notes.append("\n✅ This internship appears legitimate and safe to apply.")
-        elif trust_score >= 50:
-            notes.append("\n⚠️ Exercise caution. Verify details before applying.")
-        else:
-            notes.append("\n❌ High risk of fraud. Avoid this internship.")
-        
-        return "\n".join(notes)
+        # Only the assessment band of the score affects the wording
+        return _verification_notes(
+            signals.official_domain,
+            signals.known_platform,
+            signals.company_verified,
+            tuple(flag.description for flag in red_flags),
+            self.determine_status(trust_score)
+        )
@@ -1,8 +1,12 @@
 """
 MongoDB Database Configuration and Connection Management
+
+Also provides the shared Supabase client used by the Supabase-backed services.
 """
+from functools import lru_cache
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ConnectionFailure
+from supabase import create_client, Client
 from core.config import get_settings
 import logging
 
@@ -69,3 +73,8 @@ async def create_indexes():
 def get_database():
     """Get MongoDB database instance"""
     return mongodb.db
+
+@lru_cache(maxsize=1)
+def get_supabase_client() -> Client:
+    """Get the Supabase client, created on first use and reused afterwards"""
+    return create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
@@ -1,14 +1,23 @@
 """
 Pytest configuration and fixtures for VidyaMitra tests
 """
+import os
 import pytest
 from hypothesis import settings, Verbosity
+from app.services.matching_service import MatchingService
 
-# Configure Hypothesis for property-based testing
+# Configure Hypothesis for property-based testing; pick the profile with
+# HYPOTHESIS_PROFILE (CI defaults to "ci", local runs to the quick "dev" profile)
 settings.register_profile("default", max_examples=100, verbosity=Verbosity.normal)
-settings.register_profile("ci", max_examples=200, verbosity=Verbosity.verbose)
-settings.register_profile("dev", max_examples=50, verbosity=Verbosity.normal)
-settings.load_profile("default")
+settings.register_profile("ci", max_examples=200, deadline=None, verbosity=Verbosity.verbose)
+settings.register_profile("dev", max_examples=20, deadline=None, verbosity=Verbosity.normal)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "ci" if os.getenv("CI") else "dev"))
+
+
+@pytest.fixture(scope="session")
+def matching_service():
+    """MatchingService shared by the whole run (it holds no per-test state)"""
+    return MatchingService()
 
 
 @pytest.fixture
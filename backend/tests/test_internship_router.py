@@ -9,7 +9,8 @@ Tests the profile management endpoints:
 """
 
 import pytest
-from unittest.mock import Mock, patch, AsyncMock, MagicMock
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch, AsyncMock, MagicMock, create_autospec
 from datetime import datetime
 from fastapi import HTTPException
 
@@ -18,6 +19,7 @@ from app.routers.internship import (
     get_profile,
     update_profile,
     calculate_skill_match,
+    get_internship_calendar,
 )
 from app.models.internship import (
     StudentProfile,
@@ -28,6 +30,7 @@ from app.models.internship import (
     SkillMatch,
     LearningPathItem,
 )
+from app.services.internship_service_mongo import InternshipServiceMongo
 from app.services.internship_service import (
     ProfileValidationError,
     ProfileNotFoundError,
@@ -35,33 +38,55 @@ from app.services.internship_service import (
 )
 
 
-@pytest.fixture
+# Fixed timestamp for created_at/updated_at so fixtures are deterministic
+_NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+# Note: StudentProfile test data below is built with model_construct(), which
+# skips validation. The field values are static and known to be valid, so only
+# the endpoint code under test pays for model work.
+
+
+@pytest.fixture(scope="module")
 def mock_user():
     """Mock authenticated user"""
     return {"email": "test@example.com", "sub": "test@example.com"}
 
 
-@pytest.fixture
+# Shared, read-only payloads validated/built once at import
+_SAMPLE_PROFILE_CREATE = StudentProfileCreate(
+    graduation_year=2026,
+    current_semester=4,
+    degree="B.Tech",
+    branch="Computer Science",
+    skills=["Python", "JavaScript", "React"],
+    preferred_roles=["Software Engineer", "Full Stack Developer"],
+    internship_type=LocationPreference.REMOTE,
+    compensation_preference=CompensationPreference.PAID,
+    target_companies=["Google", "Microsoft"],
+    resume_url="https://example.com/resume.pdf"
+)
+
+_SAMPLE_INTERNSHIP = MappingProxyType({
+    "id": "internship-123",
+    "title": "Software Engineering Intern",
+    "company": "TechCorp",
+    "required_skills": ["Python", "JavaScript", "Django", "REST API"],
+    "preferred_skills": ["React", "Docker"],
+    "location": "Remote",
+    "stipend": "₹15,000/month"
+})
+
+
+@pytest.fixture(scope="session")
 def sample_profile_data():
     """Sample profile data for testing"""
-    return StudentProfileCreate(
-        graduation_year=2026,
-        current_semester=4,
-        degree="B.Tech",
-        branch="Computer Science",
-        skills=["Python", "JavaScript", "React"],
-        preferred_roles=["Software Engineer", "Full Stack Developer"],
-        internship_type=LocationPreference.REMOTE,
-        compensation_preference=CompensationPreference.PAID,
-        target_companies=["Google", "Microsoft"],
-        resume_url="https://example.com/resume.pdf"
-    )
+    return _SAMPLE_PROFILE_CREATE
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_profile_response():
     """Sample profile response from service"""
-    return StudentProfile(
+    return StudentProfile.model_construct(
         id="123e4567-e89b-12d3-a456-426614174000",
         user_id="test@example.com",
         graduation_year=2026,
@@ -74,11 +99,46 @@ def sample_profile_response():
         compensation_preference=CompensationPreference.PAID,
         target_companies=["Google", "Microsoft"],
         resume_url="https://example.com/resume.pdf",
-        created_at=datetime.now(),
-        updated_at=datetime.now()
+        created_at=_NOW,
+        updated_at=_NOW
     )
 
 
+@pytest.fixture(scope="module")
+def sample_profile_dict(sample_profile_response):
+    """Serialized form of sample_profile_response, as returned in response data"""
+    return sample_profile_response.model_dump()
+
+
+@pytest.fixture(scope="session")
+def supabase_mock_factory():
+    """
+    Factory for a Supabase client mock with the query chains used by the router
+    
+    The returned mock answers the internship lookup
+    (table().select().eq().execute()) with internship_data and the skill match
+    lookup (table().select().eq().eq().execute()) with existing_match_data.
+    Query results are plain SimpleNamespace objects since only .data is read.
+    Pass mock_supabase to configure an existing (e.g. patched) mock instead.
+    """
+    def _make(internship_data, existing_match_data=None, mock_supabase=None):
+        if mock_supabase is None:
+            mock_supabase = MagicMock()
+        table = mock_supabase.table.return_value
+        table.select.return_value.eq.return_value.execute.return_value = SimpleNamespace(data=internship_data)
+        table.select.return_value.eq.return_value.eq.return_value.execute.return_value = SimpleNamespace(
+            data=existing_match_data or []
+        )
+        return mock_supabase
+    return _make
+
+
+@pytest.fixture
+def mock_service():
+    """Fresh InternshipServiceMongo mock; async methods are AsyncMocks via autospec"""
+    return create_autospec(InternshipServiceMongo, instance=True)
+
+
 class TestProfileEndpoints:
     """Test suite for profile management endpoints"""
     
@@ -87,12 +147,13 @@ class TestProfileEndpoints:
         self,
         mock_user,
         sample_profile_data,
-        sample_profile_response
+        sample_profile_response,
+        sample_profile_dict,
+        mock_service
     ):
         """Test successful profile creation"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.create_profile = AsyncMock(return_value=sample_profile_response)
+        mock_service.create_profile.return_value = sample_profile_response
         
         # Call endpoint function directly
         result = await create_or_update_profile(
@@ -103,10 +164,7 @@ class TestProfileEndpoints:
         
         # Assertions
         assert result["success"] is True
-        assert "data" in result
-        assert result["data"]["graduation_year"] == 2026
-        assert result["data"]["current_semester"] == 4
-        assert result["data"]["degree"] == "B.Tech"
+        assert result["data"] == sample_profile_dict
         
         # Verify service was called correctly
         mock_service.create_profile.assert_called_once()
@@ -118,14 +176,12 @@ class TestProfileEndpoints:
     async def test_create_profile_validation_error(
         self,
         mock_user,
-        sample_profile_data
+        sample_profile_data,
+        mock_service
     ):
         """Test profile creation with validation error"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.create_profile = AsyncMock(
-            side_effect=ProfileValidationError("Current semester must be between 1 and 8")
-        )
+        mock_service.create_profile.side_effect = ProfileValidationError("Current semester must be between 1 and 8")
         
         # Call endpoint function and expect exception
         with pytest.raises(HTTPException) as exc_info:
@@ -143,12 +199,13 @@ class TestProfileEndpoints:
     async def test_get_profile_success(
         self,
         mock_user,
-        sample_profile_response
+        sample_profile_response,
+        sample_profile_dict,
+        mock_service
     ):
         """Test successful profile retrieval"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.get_profile = AsyncMock(return_value=sample_profile_response)
+        mock_service.get_profile.return_value = sample_profile_response
         
         # Call endpoint function directly
         result = await get_profile(
@@ -158,7 +215,7 @@ class TestProfileEndpoints:
         
         # Assertions
         assert result["success"] is True
-        assert "data" in result
+        assert result["data"] == sample_profile_dict
         assert result["data"]["user_id"] == "test@example.com"
         
         # Verify service was called correctly
@@ -167,12 +224,12 @@ class TestProfileEndpoints:
     @pytest.mark.asyncio
     async def test_get_profile_not_found(
         self,
-        mock_user
+        mock_user,
+        mock_service
     ):
         """Test profile retrieval when profile doesn't exist"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.get_profile = AsyncMock(return_value=None)
+        mock_service.get_profile.return_value = None
         
         # Call endpoint function and expect exception
         with pytest.raises(HTTPException) as exc_info:
@@ -189,18 +246,17 @@ class TestProfileEndpoints:
     async def test_update_profile_success(
         self,
         mock_user,
-        sample_profile_response
+        sample_profile_response,
+        sample_profile_dict,
+        mock_service
     ):
         """Test successful profile update"""
-        # Setup mocks
-        mock_service = Mock()
-        
         # Create updated profile
         updated_profile = sample_profile_response.model_copy()
         updated_profile.current_semester = 5
         updated_profile.skills = ["Python", "JavaScript", "React", "Node.js"]
         
-        mock_service.update_profile = AsyncMock(return_value=updated_profile)
+        mock_service.update_profile.return_value = updated_profile
         
         # Create update data
         update_data = StudentProfileUpdate(
@@ -217,8 +273,11 @@ class TestProfileEndpoints:
         
         # Assertions
         assert result["success"] is True
-        assert result["data"]["current_semester"] == 5
-        assert len(result["data"]["skills"]) == 4
+        assert result["data"] == {
+            **sample_profile_dict,
+            "current_semester": 5,
+            "skills": ["Python", "JavaScript", "React", "Node.js"],
+        }
         
         # Verify service was called correctly
         mock_service.update_profile.assert_called_once()
@@ -226,14 +285,12 @@ class TestProfileEndpoints:
     @pytest.mark.asyncio
     async def test_update_profile_not_found(
         self,
-        mock_user
+        mock_user,
+        mock_service
     ):
         """Test profile update when profile doesn't exist"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.update_profile = AsyncMock(
-            side_effect=ProfileNotFoundError("Profile not found for user: test@example.com")
-        )
+        mock_service.update_profile.side_effect = ProfileNotFoundError("Profile not found for user: test@example.com")
         
         # Create update data
         update_data = StudentProfileUpdate(current_semester=5)
@@ -254,14 +311,12 @@ class TestProfileEndpoints:
     async def test_database_error_handling(
         self,
         mock_user,
-        sample_profile_data
+        sample_profile_data,
+        mock_service
     ):
         """Test handling of database errors"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.create_profile = AsyncMock(
-            side_effect=DatabaseOperationError("Database connection failed")
-        )
+        mock_service.create_profile.side_effect = DatabaseOperationError("Database connection failed")
         
         # Call endpoint function and expect exception
         with pytest.raises(HTTPException) as exc_info:
@@ -276,18 +331,21 @@ class TestProfileEndpoints:
         assert "DATABASE_ERROR" in str(exc_info.value.detail)
 
 
+@patch('app.services.matching_service.MatchingService')
+@patch('app.routers.internship.get_supabase_client')
 class TestSkillMatchEndpoint:
-    """Test suite for skill matching endpoint"""
+    """
+    Test suite for skill matching endpoint
     
-    @pytest.fixture
-    def mock_user(self):
-        """Mock authenticated user"""
-        return {"email": "test@example.com", "sub": "test@example.com"}
+    The router's get_supabase_client and MatchingService are patched once for
+    the whole class; every test receives the mocks as
+    (mock_get_supabase_client, mock_matching_service_cls).
+    """
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_profile(self):
         """Sample user profile"""
-        return StudentProfile(
+        return StudentProfile.model_construct(
             id="123e4567-e89b-12d3-a456-426614174000",
             user_id="test@example.com",
             graduation_year=2026,
@@ -300,24 +358,16 @@ class TestSkillMatchEndpoint:
             compensation_preference=CompensationPreference.PAID,
             target_companies=[],
             resume_url=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=_NOW,
+            updated_at=_NOW
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def sample_internship(self):
-        """Sample internship listing"""
-        return {
-            "id": "internship-123",
-            "title": "Software Engineering Intern",
-            "company": "TechCorp",
-            "required_skills": ["Python", "JavaScript", "Django", "REST API"],
-            "preferred_skills": ["React", "Docker"],
-            "location": "Remote",
-            "stipend": "₹15,000/month"
-        }
+        """Sample internship listing (read-only; copy before modifying)"""
+        return _SAMPLE_INTERNSHIP
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_skill_match(self):
         """Sample skill match result"""
         return SkillMatch(
@@ -351,69 +401,62 @@ class TestSkillMatchEndpoint:
                     priority="High"
                 )
             ],
-            created_at=datetime.now()
+            created_at=_NOW
         )
     
     @pytest.mark.asyncio
     async def test_calculate_skill_match_success(
         self,
+        mock_get_supabase_client,
+        mock_matching_service_cls,
         mock_user,
         sample_profile,
         sample_internship,
-        sample_skill_match
+        sample_skill_match,
+        supabase_mock_factory,
+        mock_service
     ):
         """Test successful skill match calculation"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.get_profile = AsyncMock(return_value=sample_profile)
+        mock_service.get_profile.return_value = sample_profile
         
         # Mock Supabase client
-        mock_supabase = MagicMock()
-        mock_internship_result = MagicMock()
-        mock_internship_result.data = [sample_internship]
-        mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = mock_internship_result
-        
-        # Mock skill match result
-        mock_match_result = MagicMock()
-        mock_match_result.data = []
-        mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value.execute.return_value = mock_match_result
+        supabase_mock_factory([sample_internship], mock_supabase=mock_get_supabase_client.return_value)
         
         # Mock matching service
-        mock_matching_service = Mock()
+        mock_matching_service = mock_matching_service_cls.return_value
         mock_matching_service.create_skill_match = AsyncMock(return_value=sample_skill_match)
         
-        # Patch dependencies
-        with patch('app.routers.internship.supabase', mock_supabase), \
-             patch('app.services.matching_service.MatchingService', return_value=mock_matching_service):
-            
-            # Call endpoint
-            result = await calculate_skill_match(
-                internship_id="internship-123",
-                current_user=mock_user,
-                service=mock_service
-            )
-            
-            # Assertions
-            assert result["success"] is True
-            assert "data" in result
-            assert result["data"]["match_percentage"] == 75
-            assert len(result["data"]["matching_skills"]) == 3
-            assert len(result["data"]["missing_skills"]) == 2
-            assert len(result["data"]["learning_path"]) == 2
-            
-            # Verify service calls
-            mock_service.get_profile.assert_called_once_with("test@example.com")
-            mock_matching_service.create_skill_match.assert_called_once()
+        # Call endpoint
+        result = await calculate_skill_match(
+            internship_id="internship-123",
+            current_user=mock_user,
+            service=mock_service
+        )
+        
+        # Assertions
+        assert result["success"] is True
+        assert "data" in result
+        assert result["data"]["match_percentage"] == 75
+        assert len(result["data"]["matching_skills"]) == 3
+        assert len(result["data"]["missing_skills"]) == 2
+        assert len(result["data"]["learning_path"]) == 2
+        
+        # Verify service calls
+        mock_service.get_profile.assert_called_once_with("test@example.com")
+        mock_matching_service.create_skill_match.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_calculate_skill_match_no_profile(
         self,
-        mock_user
+        mock_get_supabase_client,
+        mock_matching_service_cls,
+        mock_user,
+        mock_service
     ):
         """Test skill match calculation when user has no profile"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.get_profile = AsyncMock(return_value=None)
+        mock_service.get_profile.return_value = None
         
         # Call endpoint and expect exception
         with pytest.raises(HTTPException) as exc_info:
@@ -430,46 +473,46 @@ class TestSkillMatchEndpoint:
     @pytest.mark.asyncio
     async def test_calculate_skill_match_internship_not_found(
         self,
+        mock_get_supabase_client,
+        mock_matching_service_cls,
         mock_user,
-        sample_profile
+        sample_profile,
+        supabase_mock_factory,
+        mock_service
     ):
         """Test skill match calculation when internship doesn't exist"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.get_profile = AsyncMock(return_value=sample_profile)
+        mock_service.get_profile.return_value = sample_profile
         
         # Mock Supabase client - no internship found
-        mock_supabase = MagicMock()
-        mock_internship_result = MagicMock()
-        mock_internship_result.data = []
-        mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = mock_internship_result
-        
-        # Patch dependencies
-        with patch('app.routers.internship.supabase', mock_supabase):
-            
-            # Call endpoint and expect exception
-            with pytest.raises(HTTPException) as exc_info:
-                await calculate_skill_match(
-                    internship_id="nonexistent-123",
-                    current_user=mock_user,
-                    service=mock_service
-                )
-            
-            # Assertions
-            assert exc_info.value.status_code == 404
-            assert "INTERNSHIP_NOT_FOUND" in str(exc_info.value.detail)
+        supabase_mock_factory([], mock_supabase=mock_get_supabase_client.return_value)
+        
+        # Call endpoint and expect exception
+        with pytest.raises(HTTPException) as exc_info:
+            await calculate_skill_match(
+                internship_id="nonexistent-123",
+                current_user=mock_user,
+                service=mock_service
+            )
+        
+        # Assertions
+        assert exc_info.value.status_code == 404
+        assert "INTERNSHIP_NOT_FOUND" in str(exc_info.value.detail)
     
     @pytest.mark.asyncio
     async def test_calculate_skill_match_100_percent(
         self,
+        mock_get_supabase_client,
+        mock_matching_service_cls,
         mock_user,
         sample_profile,
-        sample_internship
+        sample_internship,
+        supabase_mock_factory,
+        mock_service
     ):
         """Test skill match with 100% match"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.get_profile = AsyncMock(return_value=sample_profile)
+        mock_service.get_profile.return_value = sample_profile
         
         # Modify internship to only require skills user has
         internship_with_matching_skills = sample_internship.copy()
@@ -477,15 +520,7 @@ class TestSkillMatchEndpoint:
         internship_with_matching_skills["preferred_skills"] = ["React"]
         
         # Mock Supabase client
-        mock_supabase = MagicMock()
-        mock_internship_result = MagicMock()
-        mock_internship_result.data = [internship_with_matching_skills]
-        mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value = mock_internship_result
-        
-        # Mock skill match result
-        mock_match_result = MagicMock()
-        mock_match_result.data = []
-        mock_supabase.table.return_value.select.return_value.eq.return_value.eq.return_value.execute.return_value = mock_match_result
+        supabase_mock_factory([internship_with_matching_skills], mock_supabase=mock_get_supabase_client.return_value)
         
         # Create 100% match result
         perfect_match = SkillMatch(
@@ -496,90 +531,67 @@ class TestSkillMatchEndpoint:
             matching_skills=["Python", "JavaScript", "React"],
             missing_skills=[],
             learning_path=[],
-            created_at=datetime.now()
+            created_at=_NOW
         )
         
         # Mock matching service
-        mock_matching_service = Mock()
-        mock_matching_service.create_skill_match = AsyncMock(return_value=perfect_match)
-        
-        # Patch dependencies
-        with patch('app.routers.internship.supabase', mock_supabase), \
-             patch('app.services.matching_service.MatchingService', return_value=mock_matching_service):
-            
-            # Call endpoint
-            result = await calculate_skill_match(
-                internship_id="internship-123",
-                current_user=mock_user,
-                service=mock_service
-            )
-            
-            # Assertions
-            assert result["success"] is True
-            assert result["data"]["match_percentage"] == 100
-            assert len(result["data"]["missing_skills"]) == 0
-            assert len(result["data"]["learning_path"]) == 0
+        mock_matching_service_cls.return_value.create_skill_match = AsyncMock(return_value=perfect_match)
+        
+        # Call endpoint
+        result = await calculate_skill_match(
+            internship_id="internship-123",
+            current_user=mock_user,
+            service=mock_service
+        )
+        
+        # Assertions
+        assert result["success"] is True
+        assert result["data"]["match_percentage"] == 100
+        assert len(result["data"]["missing_skills"]) == 0
+        assert len(result["data"]["learning_path"]) == 0
     
     @pytest.mark.asyncio
     async def test_calculate_skill_match_caching(
         self,
+        mock_get_supabase_client,
+        mock_matching_service_cls,
         mock_user,
         sample_profile,
         sample_internship,
-        sample_skill_match
+        sample_skill_match,
+        supabase_mock_factory,
+        mock_service
     ):
         """Test that skill match results are cached in database"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.get_profile = AsyncMock(return_value=sample_profile)
-        
-        # Mock Supabase client
-        mock_supabase = MagicMock()
-        mock_internship_result = MagicMock()
-        mock_internship_result.data = [sample_internship]
+        mock_service.get_profile.return_value = sample_profile
         
-        # Mock existing match check (no existing match)
-        mock_existing_match = MagicMock()
-        mock_existing_match.data = []
+        # Mock Supabase client (no existing match)
+        supabase_mock_factory([sample_internship], mock_supabase=mock_get_supabase_client.return_value)
+        mock_table = mock_get_supabase_client.return_value.table.return_value
         
         # Mock insert result
-        mock_insert_result = MagicMock()
-        
-        # Setup call chain
-        mock_table = MagicMock()
-        mock_supabase.table.return_value = mock_table
+        mock_table.insert.return_value.execute.return_value = SimpleNamespace(data=[])
         
-        # For internship lookup
-        mock_table.select.return_value.eq.return_value.execute.return_value = mock_internship_result
+        # Mock matching service
+        mock_matching_service_cls.return_value.create_skill_match = AsyncMock(return_value=sample_skill_match)
         
-        # For skill match check and insert
-        mock_table.select.return_value.eq.return_value.eq.return_value.execute.return_value = mock_existing_match
-        mock_table.insert.return_value.execute.return_value = mock_insert_result
+        # Call endpoint
+        result = await calculate_skill_match(
+            internship_id="internship-123",
+            current_user=mock_user,
+            service=mock_service
+        )
         
-        # Mock matching service
-        mock_matching_service = Mock()
-        mock_matching_service.create_skill_match = AsyncMock(return_value=sample_skill_match)
+        # Assertions
+        assert result["success"] is True
         
-        # Patch dependencies
-        with patch('app.routers.internship.supabase', mock_supabase), \
-             patch('app.services.matching_service.MatchingService', return_value=mock_matching_service):
-            
-            # Call endpoint
-            result = await calculate_skill_match(
-                internship_id="internship-123",
-                current_user=mock_user,
-                service=mock_service
-            )
-            
-            # Assertions
-            assert result["success"] is True
-            
-            # Verify insert was called (caching)
-            mock_table.insert.assert_called_once()
-            insert_call_args = mock_table.insert.call_args[0][0]
-            assert insert_call_args["user_id"] == "test@example.com"
-            assert insert_call_args["internship_id"] == "internship-123"
-            assert insert_call_args["match_percentage"] == 75
+        # Verify insert was called (caching)
+        mock_table.insert.assert_called_once()
+        insert_call_args = mock_table.insert.call_args[0][0]
+        assert insert_call_args["user_id"] == "test@example.com"
+        assert insert_call_args["internship_id"] == "internship-123"
+        assert insert_call_args["match_percentage"] == 75
 
 
 
@@ -587,15 +599,10 @@ class TestSkillMatchEndpoint:
 class TestCalendarEndpoint:
     """Test suite for calendar endpoint"""
     
-    @pytest.fixture
-    def mock_user(self):
-        """Mock authenticated user"""
-        return {"email": "test@example.com", "sub": "test@example.com"}
-    
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_profile_semester_4(self):
         """Sample user profile in semester 4"""
-        return StudentProfile(
+        return StudentProfile.model_construct(
             id="123e4567-e89b-12d3-a456-426614174000",
             user_id="test@example.com",
             graduation_year=2026,
@@ -608,14 +615,14 @@ class TestCalendarEndpoint:
             compensation_preference=CompensationPreference.PAID,
             target_companies=[],
             resume_url=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=_NOW,
+            updated_at=_NOW
         )
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_profile_semester_1(self):
         """Sample user profile in semester 1"""
-        return StudentProfile(
+        return StudentProfile.model_construct(
             id="123e4567-e89b-12d3-a456-426614174001",
             user_id="test@example.com",
             graduation_year=2027,
@@ -628,23 +635,20 @@ class TestCalendarEndpoint:
             compensation_preference=CompensationPreference.PAID,
             target_companies=[],
             resume_url=None,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=_NOW,
+            updated_at=_NOW
         )
     
     @pytest.mark.asyncio
     async def test_get_calendar_success_semester_4(
         self,
         mock_user,
-        sample_profile_semester_4
+        sample_profile_semester_4,
+        mock_service
     ):
         """Test successful calendar retrieval for semester 4"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.get_profile = AsyncMock(return_value=sample_profile_semester_4)
-        
-        # Import endpoint function
-        from app.routers.internship import get_internship_calendar
+        mock_service.get_profile.return_value = sample_profile_semester_4
         
         # Call endpoint
         result = await get_internship_calendar(
@@ -669,15 +673,12 @@ class TestCalendarEndpoint:
     async def test_get_calendar_success_semester_1(
         self,
         mock_user,
-        sample_profile_semester_1
+        sample_profile_semester_1,
+        mock_service
     ):
         """Test successful calendar retrieval for semester 1 (skill building)"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.get_profile = AsyncMock(return_value=sample_profile_semester_1)
-        
-        # Import endpoint function
-        from app.routers.internship import get_internship_calendar
+        mock_service.get_profile.return_value = sample_profile_semester_1
         
         # Call endpoint
         result = await get_internship_calendar(
@@ -699,15 +700,12 @@ class TestCalendarEndpoint:
     @pytest.mark.asyncio
     async def test_get_calendar_no_profile(
         self,
-        mock_user
+        mock_user,
+        mock_service
     ):
         """Test calendar retrieval when user has no profile"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.get_profile = AsyncMock(return_value=None)
-        
-        # Import endpoint function
-        from app.routers.internship import get_internship_calendar
+        mock_service.get_profile.return_value = None
         
         # Call endpoint and expect exception
         with pytest.raises(HTTPException) as exc_info:
@@ -721,64 +719,59 @@ class TestCalendarEndpoint:
         assert "PROFILE_NOT_FOUND" in str(exc_info.value.detail)
         assert "create a profile" in str(exc_info.value.detail).lower()
     
+    @pytest.mark.parametrize("semester", range(1, 9))
     @pytest.mark.asyncio
     async def test_get_calendar_all_semesters(
         self,
-        mock_user
+        mock_user,
+        semester,
+        mock_service
     ):
         """Test calendar retrieval for all semesters (1-8)"""
-        # Import endpoint function
-        from app.routers.internship import get_internship_calendar
-        
-        for semester in range(1, 9):
-            # Create profile for this semester
-            profile = StudentProfile(
-                id=f"123e4567-e89b-12d3-a456-42661417400{semester}",
-                user_id="test@example.com",
-                graduation_year=2026,
-                current_semester=semester,
-                degree="B.Tech",
-                branch="Computer Science",
-                skills=["Python"],
-                preferred_roles=["Software Engineer"],
-                internship_type=LocationPreference.REMOTE,
-                compensation_preference=CompensationPreference.PAID,
-                target_companies=[],
-                resume_url=None,
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            )
-            
-            # Setup mocks
-            mock_service = Mock()
-            mock_service.get_profile = AsyncMock(return_value=profile)
-            
-            # Call endpoint
-            result = await get_internship_calendar(
-                current_user=mock_user,
-                service=mock_service
-            )
-            
-            # Assertions
-            assert result["success"] is True
-            assert result["data"]["semester"] == semester
-            assert "focus" in result["data"]
-            assert "recommendation" in result["data"]
-            assert "current_status" in result["data"]
+        # Create profile for this semester
+        profile = StudentProfile.model_construct(
+            id=f"123e4567-e89b-12d3-a456-42661417400{semester}",
+            user_id="test@example.com",
+            graduation_year=2026,
+            current_semester=semester,
+            degree="B.Tech",
+            branch="Computer Science",
+            skills=["Python"],
+            preferred_roles=["Software Engineer"],
+            internship_type=LocationPreference.REMOTE,
+            compensation_preference=CompensationPreference.PAID,
+            target_companies=[],
+            resume_url=None,
+            created_at=_NOW,
+            updated_at=_NOW
+        )
+        
+        # Setup mocks
+        mock_service.get_profile.return_value = profile
+        
+        # Call endpoint
+        result = await get_internship_calendar(
+            current_user=mock_user,
+            service=mock_service
+        )
+        
+        # Assertions
+        assert result["success"] is True
+        assert result["data"]["semester"] == semester
+        assert "focus" in result["data"]
+        assert "recommendation" in result["data"]
+        assert "current_status" in result["data"]
     
     @pytest.mark.asyncio
     async def test_get_calendar_includes_deadlines(
         self,
         mock_user,
-        sample_profile_semester_4
+        sample_profile_semester_4,
+        mock_service
     ):
         """Test that calendar includes upcoming deadlines"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.get_profile = AsyncMock(return_value=sample_profile_semester_4)
-        
-        # Import endpoint function
-        from app.routers.internship import get_internship_calendar
+        mock_service.get_profile.return_value = sample_profile_semester_4
         
         # Call endpoint
         result = await get_internship_calendar(
@@ -803,17 +796,12 @@ class TestCalendarEndpoint:
     @pytest.mark.asyncio
     async def test_get_calendar_database_error(
         self,
-        mock_user
+        mock_user,
+        mock_service
     ):
         """Test handling of database errors"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.get_profile = AsyncMock(
-            side_effect=DatabaseOperationError("Database connection failed")
-        )
-        
-        # Import endpoint function
-        from app.routers.internship import get_internship_calendar
+        mock_service.get_profile.side_effect = DatabaseOperationError("Database connection failed")
         
         # Call endpoint and expect exception
         with pytest.raises(HTTPException) as exc_info:
@@ -831,15 +819,12 @@ class TestCalendarEndpoint:
     async def test_get_calendar_response_format(
         self,
         mock_user,
-        sample_profile_semester_4
+        sample_profile_semester_4,
+        mock_service
     ):
         """Test that calendar response has correct format"""
         # Setup mocks
-        mock_service = Mock()
-        mock_service.get_profile = AsyncMock(return_value=sample_profile_semester_4)
-        
-        # Import endpoint function
-        from app.routers.internship import get_internship_calendar
+        mock_service.get_profile.return_value = sample_profile_semester_4
         
         # Call endpoint
         result = await get_internship_calendar(
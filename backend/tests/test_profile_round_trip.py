@@ -10,7 +10,8 @@ Validates: Requirements 1.1, 1.3, 1.4, 1.6, 1.7, 1.8, 1.9
 import pytest
 import os
 import uuid
-from hypothesis import given, strategies as st, settings, assume
+from datetime import datetime
+from hypothesis import given, strategies as st, settings, assume, HealthCheck
 from typing import List
 from supabase import create_client, Client
 
@@ -27,8 +28,10 @@ from app.services.internship_service import InternshipService
 # Hypothesis Strategies for generating test data
 # ============================================================================
 
-# Strategy for valid graduation years (2024-2035)
-graduation_year_strategy = st.integers(min_value=2024, max_value=2035)
+# Strategy for valid graduation years: InternshipService accepts the current
+# year up to 10 years ahead, and StudentProfileCreate caps the field at 2035
+_CURRENT_YEAR = datetime.now().year
+graduation_year_strategy = st.integers(min_value=_CURRENT_YEAR, max_value=min(_CURRENT_YEAR + 10, 2035))
 
 # Strategy for valid semesters (1-8)
 valid_semester_strategy = st.integers(min_value=1, max_value=8)
@@ -81,6 +84,30 @@ companies_strategy = st.lists(
 )
 
 
+# Strategies for the preference enums (stored by value)
+_LOCATION_STRATEGY = st.sampled_from(tuple(e.value for e in LocationPreference))
+_COMPENSATION_STRATEGY = st.sampled_from(tuple(e.value for e in CompensationPreference))
+
+# Strategy for complete profiles, built from the field strategies above
+profile_strategy = st.builds(
+    StudentProfileCreate,
+    graduation_year=graduation_year_strategy,
+    current_semester=valid_semester_strategy,
+    degree=degree_strategy,
+    branch=branch_strategy,
+    skills=skills_strategy,
+    preferred_roles=roles_strategy,
+    internship_type=_LOCATION_STRATEGY,
+    compensation_preference=_COMPENSATION_STRATEGY,
+    target_companies=companies_strategy,
+    resume_url=st.one_of(st.none(), st.just("https://example.com/resume.pdf"))
+)
+
+# Every example makes real database round-trips, and the service/user-id
+# fixtures are deliberately shared by all examples of a test
+_DB_HEALTH_CHECKS = [HealthCheck.too_slow, HealthCheck.function_scoped_fixture]
+
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -127,6 +154,24 @@ async def cleanup_profile(supabase_client, test_user_id):
         pass  # Ignore cleanup errors
 
 
+@pytest.fixture(scope="module")
+def created_user_ids(supabase_client):
+    """
+    Collect user IDs created by the property tests and remove them all at once
+    
+    Hypothesis runs many examples per test; deleting each profile as it is made
+    costs one request per example, so the ids are gathered here and deleted with
+    a single bulk request when the module finishes.
+    """
+    user_ids: List[str] = []
+    yield user_ids
+    if user_ids:
+        try:
+            supabase_client.table('student_profiles').delete().in_('user_id', user_ids).execute()
+        except Exception:
+            pass  # Ignore cleanup errors
+
+
 # ============================================================================
 # Property 1: Profile Data Round-Trip
 # Feature: internship-discovery, Property 1: Profile Data Round-Trip
@@ -136,33 +181,13 @@ async def cleanup_profile(supabase_client, test_user_id):
 @pytest.mark.property
 @pytest.mark.internship
 @pytest.mark.asyncio
-@settings(max_examples=100, deadline=None)
-@given(
-    graduation_year=graduation_year_strategy,
-    current_semester=valid_semester_strategy,
-    degree=degree_strategy,
-    branch=branch_strategy,
-    skills=skills_strategy,
-    preferred_roles=roles_strategy,
-    internship_type=st.sampled_from([e.value for e in LocationPreference]),
-    compensation_preference=st.sampled_from([e.value for e in CompensationPreference]),
-    target_companies=companies_strategy,
-    resume_url=st.one_of(st.none(), st.just("https://example.com/resume.pdf"))
-)
+@settings(max_examples=100, deadline=None, suppress_health_check=_DB_HEALTH_CHECKS)
+@given(profile_data=profile_strategy)
 async def test_profile_data_round_trip_database(
-    graduation_year: int,
-    current_semester: int,
-    degree: str,
-    branch: str,
-    skills: List[str],
-    preferred_roles: List[str],
-    internship_type: str,
-    compensation_preference: str,
-    target_companies: List[str],
-    resume_url: str,
+    profile_data: StudentProfileCreate,
     internship_service,
     test_user_id,
-    cleanup_profile
+    created_user_ids
 ):
     """
     Property 1: Profile Data Round-Trip (Database)
@@ -179,50 +204,9 @@ async def test_profile_data_round_trip_database(
     - Compensation preference is preserved (Requirement 1.8)
     - Target companies are preserved (Requirement 1.9)
     """
-    # Create profile data
-    profile_data = StudentProfileCreate(
-        graduation_year=graduation_year,
-        current_semester=current_semester,
-        degree=degree,
-        branch=branch,
-        skills=skills,
-        preferred_roles=preferred_roles,
-        internship_type=internship_type,
-        compensation_preference=compensation_preference,
-        target_companies=target_companies,
-        resume_url=resume_url
-    )
-    
     # Store the profile in the database
-    created_profile = await internship_service.create_profile(test_user_id, profile_data)
-    
-    # Verify the created profile has all fields
-    assert created_profile is not None
-    assert created_profile.user_id == test_user_id
-    assert created_profile.graduation_year == graduation_year
-    assert created_profile.current_semester == current_semester
-    assert created_profile.degree == degree
-    assert created_profile.branch == branch
-    assert created_profile.skills == skills
-    assert created_profile.preferred_roles == preferred_roles
-    
-    # Handle enum comparison
-    if internship_type:
-        assert created_profile.internship_type == internship_type or \
-               (hasattr(created_profile.internship_type, 'value') and 
-                created_profile.internship_type.value == internship_type)
-    else:
-        assert created_profile.internship_type is None
-    
-    if compensation_preference:
-        assert created_profile.compensation_preference == compensation_preference or \
-               (hasattr(created_profile.compensation_preference, 'value') and 
-                created_profile.compensation_preference.value == compensation_preference)
-    else:
-        assert created_profile.compensation_preference is None
-    
-    assert created_profile.target_companies == target_companies
-    assert created_profile.resume_url == resume_url
+    created_user_ids.append(test_user_id)
+    await internship_service.create_profile(test_user_id, profile_data)
     
     # Retrieve the profile from the database
     retrieved_profile = await internship_service.get_profile(test_user_id)
@@ -230,40 +214,43 @@ async def test_profile_data_round_trip_database(
     # Verify the retrieved profile matches the original data
     assert retrieved_profile is not None
     assert retrieved_profile.user_id == test_user_id
-    assert retrieved_profile.graduation_year == graduation_year
-    assert retrieved_profile.current_semester == current_semester
-    assert retrieved_profile.degree == degree
-    assert retrieved_profile.branch == branch
-    assert retrieved_profile.skills == skills
-    assert retrieved_profile.preferred_roles == preferred_roles
-    
-    # Handle enum comparison for retrieved profile
-    if internship_type:
-        assert retrieved_profile.internship_type == internship_type or \
-               (hasattr(retrieved_profile.internship_type, 'value') and 
-                retrieved_profile.internship_type.value == internship_type)
-    else:
-        assert retrieved_profile.internship_type is None
-    
-    if compensation_preference:
-        assert retrieved_profile.compensation_preference == compensation_preference or \
-               (hasattr(retrieved_profile.compensation_preference, 'value') and 
-                retrieved_profile.compensation_preference.value == compensation_preference)
-    else:
-        assert retrieved_profile.compensation_preference is None
+    assert retrieved_profile.graduation_year == profile_data.graduation_year
+    assert retrieved_profile.current_semester == profile_data.current_semester
+    assert retrieved_profile.degree == profile_data.degree
+    assert retrieved_profile.branch == profile_data.branch
+    assert retrieved_profile.skills == profile_data.skills
+    assert retrieved_profile.preferred_roles == profile_data.preferred_roles
+    assert retrieved_profile.internship_type == profile_data.internship_type
+    assert retrieved_profile.compensation_preference == profile_data.compensation_preference
+    assert retrieved_profile.target_companies == profile_data.target_companies
+    assert retrieved_profile.resume_url == profile_data.resume_url
+
+
+@pytest.mark.property
+@pytest.mark.internship
+@pytest.mark.asyncio
+@settings(max_examples=10, deadline=None, suppress_health_check=_DB_HEALTH_CHECKS)
+@given(profiles=st.lists(profile_strategy, min_size=1, max_size=10))
+async def test_profile_data_round_trip_database_batch(profiles, internship_service, created_user_ids):
+    """
+    Property 1: Profile Data Round-Trip (Database, batched)
     
-    assert retrieved_profile.target_companies == target_companies
-    assert retrieved_profile.resume_url == resume_url
+    Stores a whole batch of generated profiles under fresh user IDs, then reads
+    them all back; each retrieved profile must equal the data it was created from.
+    The batch is written with one upsert and read with one query rather than
+    a round-trip per profile.
+    """
+    batch = {str(uuid.uuid4()): profile_data for profile_data in profiles}
+    created_user_ids.extend(batch)
+    await internship_service.upsert_profiles(batch)
+    retrieved = await internship_service.get_profiles(list(batch))
     
-    # Verify that created and retrieved profiles are equivalent
-    assert created_profile.graduation_year == retrieved_profile.graduation_year
-    assert created_profile.current_semester == retrieved_profile.current_semester
-    assert created_profile.degree == retrieved_profile.degree
-    assert created_profile.branch == retrieved_profile.branch
-    assert created_profile.skills == retrieved_profile.skills
-    assert created_profile.preferred_roles == retrieved_profile.preferred_roles
-    assert created_profile.target_companies == retrieved_profile.target_companies
-    assert created_profile.resume_url == retrieved_profile.resume_url
+    assert retrieved.keys() == batch.keys()
+    for user_id, profile_data in batch.items():
+        retrieved_profile = retrieved[user_id]
+        assert retrieved_profile.user_id == user_id
+        assert retrieved_profile.model_dump(include=set(StudentProfileCreate.model_fields)) == \
+            profile_data.model_dump()
 
 
 # ============================================================================
@@ -5,6 +5,7 @@ Tests cover specific edge cases and boundary conditions for the verification ser
 """
 
 import pytest
+from types import MappingProxyType
 from app.services.verification_service import VerificationService
 from app.models.internship import (
     InternshipListing,
@@ -17,16 +18,58 @@ from app.models.internship import (
 from datetime import date
 
 
-@pytest.fixture
+# Inputs for the parametrized red-flag detection tests
+_REGISTRATION_FEE_KEYWORDS = (
+    "registration fee",
+    "enrollment fee",
+    "joining fee",
+    "application fee",
+    "processing fee",
+    "security deposit",
+)
+
+_WHATSAPP_ONLY_KEYWORDS = (
+    "whatsapp only",
+    "contact on whatsapp",
+    "whatsapp for details",
+    "message on whatsapp",
+)
+
+_VAGUE_DESCRIPTIONS = (
+    "various tasks",
+    "general work",
+    "miscellaneous duties",
+    "as assigned",
+    "flexible role",
+)
+
+_UNREALISTIC_STIPENDS = (
+    "₹60000",
+    "₹75000/month",
+    "₹100000 per month",
+    "₹80k",
+)
+
+_REALISTIC_STIPENDS = (
+    "₹10000",
+    "₹15000/month",
+    "₹20000 per month",
+    "₹25k",
+    "₹12000 per week",
+    "Unpaid",
+)
+
+
+@pytest.fixture(scope="module")
 def verification_service():
-    """Create a VerificationService instance"""
+    """Create a VerificationService instance (it holds no per-test state)"""
     return VerificationService()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def base_internship_data():
-    """Create base internship data for testing"""
-    return {
+    """Read-only base internship data; tests build variants with {**base, ...}"""
+    return MappingProxyType({
         "id": "test-internship-123",
         "title": "Software Engineering Intern",
         "company": "TechCorp",
@@ -51,7 +94,7 @@ def base_internship_data():
         "posted_date": date(2026, 1, 15),
         "is_active": True,
         "source_url": "https://linkedin.com/jobs/123"
-    }
+    })
 
 
 class TestInternshipWithNoDomain:
@@ -103,14 +146,16 @@ class TestInternshipWithMultipleRedFlags:
     
     def test_all_red_flags_present(self, verification_service, base_internship_data):
         """Test internship with all possible red flags"""
-        internship_data = base_internship_data.copy()
-        internship_data["title"] = "Intern - registration fee required"
-        internship_data["company_domain"] = "gmail.com"
-        internship_data["stipend"] = "₹100000/month"
-        internship_data["responsibilities"] = [
-            "Contact on WhatsApp only",
-            "Various tasks as assigned"
-        ]
+        internship_data = {
+            **base_internship_data,
+            "title": "Intern - registration fee required",
+            "company_domain": "gmail.com",
+            "stipend": "₹100000/month",
+            "responsibilities": [
+                "Contact on WhatsApp only",
+                "Various tasks as assigned"
+            ]
+        }
         
         red_flags = verification_service.detect_red_flags(internship_data)
         
@@ -126,10 +171,12 @@ class TestInternshipWithMultipleRedFlags:
     
     def test_multiple_high_severity_flags(self, verification_service, base_internship_data):
         """Test internship with multiple high-severity red flags"""
-        internship_data = base_internship_data.copy()
-        internship_data["title"] = "Intern - registration fee ₹5000"
-        internship_data["company_domain"] = "yahoo.com"
-        internship_data["responsibilities"] = ["WhatsApp only for communication"]
+        internship_data = {
+            **base_internship_data,
+            "title": "Intern - registration fee ₹5000",
+            "company_domain": "yahoo.com",
+            "responsibilities": ["WhatsApp only for communication"]
+        }
         
         red_flags = verification_service.detect_red_flags(internship_data)
         
@@ -274,110 +321,83 @@ class TestDomainAuthenticity:
 class TestRedFlagDetection:
     """Tests for specific red flag detection"""
     
-    def test_registration_fee_keywords(self, verification_service, base_internship_data):
+    @pytest.mark.parametrize("keyword", _REGISTRATION_FEE_KEYWORDS)
+    def test_registration_fee_keywords(self, verification_service, base_internship_data, keyword):
         """Test detection of various registration fee keywords"""
-        keywords = [
-            "registration fee",
-            "enrollment fee",
-            "joining fee",
-            "application fee",
-            "processing fee",
-            "security deposit"
-        ]
+        internship_data = {
+            **base_internship_data,
+            "title": f"Intern - {keyword} required"
+        }
         
-        for keyword in keywords:
-            internship_data = base_internship_data.copy()
-            internship_data["title"] = f"Intern - {keyword} required"
-            
-            red_flags = verification_service.detect_red_flags(internship_data)
-            flag_types = [flag.type for flag in red_flags]
-            
-            assert "registration_fee" in flag_types, f"Failed to detect: {keyword}"
+        red_flags = verification_service.detect_red_flags(internship_data)
+        flag_types = [flag.type for flag in red_flags]
+        
+        assert "registration_fee" in flag_types
     
-    def test_whatsapp_only_keywords(self, verification_service, base_internship_data):
+    @pytest.mark.parametrize("keyword", _WHATSAPP_ONLY_KEYWORDS)
+    def test_whatsapp_only_keywords(self, verification_service, base_internship_data, keyword):
         """Test detection of WhatsApp-only contact keywords"""
-        keywords = [
-            "whatsapp only",
-            "contact on whatsapp",
-            "whatsapp for details",
-            "message on whatsapp"
-        ]
+        internship_data = {
+            **base_internship_data,
+            "responsibilities": [keyword]
+        }
         
-        for keyword in keywords:
-            internship_data = base_internship_data.copy()
-            internship_data["responsibilities"] = [keyword]
-            
-            red_flags = verification_service.detect_red_flags(internship_data)
-            flag_types = [flag.type for flag in red_flags]
-            
-            assert "whatsapp_only" in flag_types, f"Failed to detect: {keyword}"
+        red_flags = verification_service.detect_red_flags(internship_data)
+        flag_types = [flag.type for flag in red_flags]
+        
+        assert "whatsapp_only" in flag_types
     
-    def test_vague_description_detection(self, verification_service, base_internship_data):
+    @pytest.mark.parametrize("description", _VAGUE_DESCRIPTIONS)
+    def test_vague_description_detection(self, verification_service, base_internship_data, description):
         """Test detection of vague job descriptions"""
-        vague_descriptions = [
-            ["various tasks"],
-            ["general work"],
-            ["miscellaneous duties"],
-            ["as assigned"],
-            ["flexible role"]
-        ]
+        internship_data = {
+            **base_internship_data,
+            "responsibilities": [description]
+        }
         
-        for description in vague_descriptions:
-            internship_data = base_internship_data.copy()
-            internship_data["responsibilities"] = description
-            
-            red_flags = verification_service.detect_red_flags(internship_data)
-            flag_types = [flag.type for flag in red_flags]
-            
-            assert "vague_description" in flag_types
+        red_flags = verification_service.detect_red_flags(internship_data)
+        flag_types = [flag.type for flag in red_flags]
+        
+        assert "vague_description" in flag_types
     
     def test_no_responsibilities_listed(self, verification_service, base_internship_data):
         """Test detection when no responsibilities are listed"""
-        internship_data = base_internship_data.copy()
-        internship_data["responsibilities"] = []
+        internship_data = {
+            **base_internship_data,
+            "responsibilities": []
+        }
         
         red_flags = verification_service.detect_red_flags(internship_data)
         flag_types = [flag.type for flag in red_flags]
         
         assert "vague_description" in flag_types
     
-    def test_unrealistic_stipend_detection(self, verification_service, base_internship_data):
+    @pytest.mark.parametrize("stipend", _UNREALISTIC_STIPENDS)
+    def test_unrealistic_stipend_detection(self, verification_service, base_internship_data, stipend):
         """Test detection of unrealistically high stipends"""
-        unrealistic_stipends = [
-            "₹60000",
-            "₹75000/month",
-            "₹100000 per month",
-            "₹80k"
-        ]
+        internship_data = {
+            **base_internship_data,
+            "stipend": stipend
+        }
         
-        for stipend in unrealistic_stipends:
-            internship_data = base_internship_data.copy()
-            internship_data["stipend"] = stipend
-            
-            red_flags = verification_service.detect_red_flags(internship_data)
-            flag_types = [flag.type for flag in red_flags]
-            
-            assert "unrealistic_stipend" in flag_types, f"Failed to detect: {stipend}"
+        red_flags = verification_service.detect_red_flags(internship_data)
+        flag_types = [flag.type for flag in red_flags]
+        
+        assert "unrealistic_stipend" in flag_types
     
-    def test_realistic_stipend_no_flag(self, verification_service, base_internship_data):
+    @pytest.mark.parametrize("stipend", _REALISTIC_STIPENDS)
+    def test_realistic_stipend_no_flag(self, verification_service, base_internship_data, stipend):
         """Test that realistic stipends don't trigger red flags"""
-        realistic_stipends = [
-            "₹10000",
-            "₹15000/month",
-            "₹20000 per month",
-            "₹25k",
-            "Unpaid"
-        ]
+        internship_data = {
+            **base_internship_data,
+            "stipend": stipend
+        }
+        
+        red_flags = verification_service.detect_red_flags(internship_data)
+        flag_types = [flag.type for flag in red_flags]
         
-        for stipend in realistic_stipends:
-            internship_data = base_internship_data.copy()
-            internship_data["stipend"] = stipend
-            
-            red_flags = verification_service.detect_red_flags(internship_data)
-            flag_types = [flag.type for flag in red_flags]
-            
-            # Should not have unrealistic_stipend flag
-            assert "unrealistic_stipend" not in flag_types, f"False positive for: {stipend}"
+        # Should not have unrealistic_stipend flag
+        assert "unrealistic_stipend" not in flag_types
 
 
 class TestVerificationNotes:
@@ -2,7 +2,9 @@
 Property-Based Tests for Verification Service
 
 These tests validate universal correctness properties using hypothesis for
-comprehensive input coverage. Each property test runs with minimum 100 iterations.
+comprehensive input coverage. The text-driven properties (6, 7) run 100 iterations
+and property 5 runs 25; property 8's input space is five booleans, so it is
+checked exhaustively over all 32 combinations instead.
 
 Properties tested:
 - Property 5: Verification Status Assignment
@@ -12,26 +14,94 @@ Properties tested:
 """
 
 import pytest
+from functools import lru_cache
+from itertools import product
+from typing import Tuple
 from hypothesis import given, strategies as st, settings
 from app.services.verification_service import VerificationService
 from app.models.internship import (
     InternshipListing,
     InternshipType,
     VerificationStatus,
+    VerificationSignals,
     RedFlagSeverity,
     RedFlag
 )
 from datetime import date
 
 
+# Every severity a red flag may carry
+_ALL_SEVERITIES = frozenset(RedFlagSeverity)
+
+# Statuses a scored listing can be assigned (PENDING only precedes verification)
+_ASSIGNED_STATUSES = frozenset({
+    VerificationStatus.VERIFIED,
+    VerificationStatus.USE_CAUTION,
+    VerificationStatus.POTENTIAL_SCAM,
+})
+
+# Placeholder red flags; scoring only looks at severity, and RedFlag is
+# immutable, so the tests share one instance per severity
+_HIGH_FLAG = RedFlag(type="test_flag", severity=RedFlagSeverity.HIGH, description="Test high severity flag")
+_MEDIUM_FLAG = RedFlag(type="test_flag", severity=RedFlagSeverity.MEDIUM, description="Test medium severity flag")
+_LOW_FLAG = RedFlag(type="test_flag", severity=RedFlagSeverity.LOW, description="Test low severity flag")
+
+
+@pytest.fixture(scope="module")
+def service():
+    """VerificationService shared by the module (it holds no per-test state)"""
+    return VerificationService()
+
+
+@lru_cache(maxsize=128)
+def _signals_and_flags_for(trust_score: int) -> Tuple[VerificationSignals, Tuple[RedFlag, ...]]:
+    """
+    Build signals and red flags that bring the score down to trust_score
+    (or just under it, since flags move in steps of 5). Cached per score,
+    as the property redraws the same few scores many times.
+    """
+    # Start with base score of 50
+    # Add/subtract to reach target trust_score
+    diff = trust_score - 50
+    
+    # Determine signals based on diff
+    official_domain = diff >= 20
+    known_platform = diff >= 40 if official_domain else diff >= 20
+    company_verified = diff >= 50 if (official_domain and known_platform) else False
+    
+    signals = VerificationSignals(
+        official_domain=official_domain,
+        known_platform=known_platform,
+        company_verified=company_verified
+    )
+    
+    # Score before any red flags
+    current_score = 50
+    if official_domain:
+        current_score += 20
+    if known_platform:
+        current_score += 20
+    if company_verified:
+        current_score += 10
+    
+    # Add red flags to decrease score if needed: as many HIGH (-20) flags as
+    # fit, then MEDIUM (-10), then LOW (-5) flags until the score is reached
+    n_high, remainder = divmod(max(0, current_score - trust_score), 20)
+    n_medium, remainder = divmod(remainder, 10)
+    n_low = (remainder + 4) // 5
+    red_flags = [_HIGH_FLAG] * n_high + [_MEDIUM_FLAG] * n_medium + [_LOW_FLAG] * n_low
+    
+    return signals, tuple(red_flags)
+
+
 # ============================================================================
 # Property 5: Verification Status Assignment
 # Validates: Requirements 3.1
 # ============================================================================
 
-@settings(max_examples=100)
+@settings(max_examples=25)
 @given(trust_score=st.integers(min_value=0, max_value=100))
-def test_property_5_verification_status_assignment(trust_score):
+def test_property_5_verification_status_assignment(service, trust_score):
     """
     Property 5: Verification Status Assignment
     
@@ -52,74 +122,22 @@ def test_property_5_verification_status_assignment(trust_score):
     
     # Create a mock internship with the given trust score
     # We'll use the verification service's logic to determine status
-    service = VerificationService()
     
     # Create mock signals and red flags that would result in this trust score
-    from app.models.internship import VerificationSignals, RedFlag
-    
-    # Start with base score of 50
-    # Add/subtract to reach target trust_score
-    diff = trust_score - 50
-    
-    # Determine signals based on diff
-    official_domain = diff >= 20
-    known_platform = diff >= 40 if official_domain else diff >= 20
-    company_verified = diff >= 50 if (official_domain and known_platform) else False
-    
-    signals = VerificationSignals(
-        official_domain=official_domain,
-        known_platform=known_platform,
-        company_verified=company_verified
-    )
-    
-    # Create red flags if needed to reach target score
-    red_flags = []
-    current_score = 50
-    if official_domain:
-        current_score += 20
-    if known_platform:
-        current_score += 20
-    if company_verified:
-        current_score += 10
-    
-    # Add red flags to decrease score if needed
-    while current_score > trust_score:
-        if current_score - trust_score >= 20:
-            red_flags.append(RedFlag(
-                type="test_flag",
-                severity=RedFlagSeverity.HIGH,
-                description="Test high severity flag"
-            ))
-            current_score -= 20
-        elif current_score - trust_score >= 10:
-            red_flags.append(RedFlag(
-                type="test_flag",
-                severity=RedFlagSeverity.MEDIUM,
-                description="Test medium severity flag"
-            ))
-            current_score -= 10
-        else:
-            red_flags.append(RedFlag(
-                type="test_flag",
-                severity=RedFlagSeverity.LOW,
-                description="Test low severity flag"
-            ))
-            current_score -= 5
+    signals, red_flags = _signals_and_flags_for(trust_score)
     
     # Calculate trust score using service
-    calculated_score = service.calculate_trust_score(signals, red_flags)
+    calculated_score = service.calculate_trust_score(signals, list(red_flags))
     
     # Determine status based on calculated score
-    if calculated_score >= 80:
-        actual_status = VerificationStatus.VERIFIED
-    elif calculated_score >= 50:
-        actual_status = VerificationStatus.USE_CAUTION
-    else:
-        actual_status = VerificationStatus.POTENTIAL_SCAM
+    actual_status = service.determine_status(calculated_score)
+    
+    # The service assigns the expected status for the generated score itself
+    assert service.determine_status(trust_score) == expected_status
     
     # Verify the status matches expected
     # Note: Due to rounding, we verify the status is correct for the calculated score
-    assert actual_status in [VerificationStatus.VERIFIED, VerificationStatus.USE_CAUTION, VerificationStatus.POTENTIAL_SCAM]
+    assert actual_status in _ASSIGNED_STATUSES
     
     # Verify score is within bounds
     assert 0 <= calculated_score <= 100
@@ -135,10 +153,11 @@ def test_property_5_verification_status_assignment(trust_score):
     company=st.text(min_size=1, max_size=50, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'))),
     domain=st.one_of(
         st.none(),
-        st.text(min_size=3, max_size=30, alphabet=st.characters(whitelist_categories=('Ll', 'Nd'))).map(lambda x: f"{x}.com")
+        st.sampled_from(sorted(VerificationService.NON_OFFICIAL_DOMAINS)),
+        st.from_regex(r"[a-z0-9]{3,30}\.com", fullmatch=True)
     )
 )
-def test_property_6_domain_verification(company, domain):
+def test_property_6_domain_verification(service, company, domain):
     """
     Property 6: Domain Verification
     
@@ -147,8 +166,6 @@ def test_property_6_domain_verification(company, domain):
     
     **Validates: Requirements 3.2**
     """
-    service = VerificationService()
-    
     # Check domain authenticity
     result = service.check_domain_authenticity(company, domain)
     
@@ -177,7 +194,7 @@ def test_property_6_domain_verification(company, domain):
         st.text(min_size=1, max_size=30, alphabet=st.characters(whitelist_categories=('Lu', 'Ll')))
     )
 )
-def test_property_7_platform_recognition(platform):
+def test_property_7_platform_recognition(service, platform):
     """
     Property 7: Platform Recognition
     
@@ -186,8 +203,6 @@ def test_property_7_platform_recognition(platform):
     
     **Validates: Requirements 3.3**
     """
-    service = VerificationService()
-    
     # Check platform legitimacy
     result = service.check_platform_legitimacy(platform)
     
@@ -208,15 +223,13 @@ def test_property_7_platform_recognition(platform):
 # Validates: Requirements 3.4, 3.5
 # ============================================================================
 
-@settings(max_examples=100)
-@given(
-    has_registration_fee=st.booleans(),
-    has_whatsapp_only=st.booleans(),
-    has_non_official_email=st.booleans(),
-    has_unrealistic_stipend=st.booleans(),
-    has_vague_description=st.booleans()
+@pytest.mark.parametrize(
+    "has_registration_fee,has_whatsapp_only,has_non_official_email,"
+    "has_unrealistic_stipend,has_vague_description",
+    list(product([False, True], repeat=5))
 )
 def test_property_8_red_flag_detection(
+    service,
     has_registration_fee,
     has_whatsapp_only,
     has_non_official_email,
@@ -231,8 +244,6 @@ def test_property_8_red_flag_detection(
     
     **Validates: Requirements 3.4, 3.5**
     """
-    service = VerificationService()
-    
     # Build internship data with specified red flags
     internship_data = {
         "title": "Software Intern",
@@ -272,12 +283,9 @@ def test_property_8_red_flag_detection(
     # Verify red flags is a list
     assert isinstance(red_flags, list)
     
-    # Verify all red flags have required fields
+    # Verify all red flags carry a known severity
     for flag in red_flags:
-        assert hasattr(flag, 'type')
-        assert hasattr(flag, 'severity')
-        assert hasattr(flag, 'description')
-        assert flag.severity in [RedFlagSeverity.LOW, RedFlagSeverity.MEDIUM, RedFlagSeverity.HIGH]
+        assert flag.severity in _ALL_SEVERITIES
     
     # Count expected red flags
     expected_flag_types = []
@@ -304,9 +312,8 @@ def test_property_8_red_flag_detection(
 # Additional Edge Case Tests
 # ============================================================================
 
-def test_verification_status_boundary_80():
+def test_verification_status_boundary_80(service):
     """Test verification status at boundary: trust_score = 80"""
-    service = VerificationService()
     from app.models.internship import VerificationSignals
     
     # Create signals that result in score of 80
@@ -317,7 +324,7 @@ def test_verification_status_boundary_80():
     )
     # Base 50 + 20 + 20 + 10 = 100, need to subtract 20
     red_flags = [
-        RedFlag(type="test", severity=RedFlagSeverity.HIGH, description="Test")
+        _HIGH_FLAG
     ]
     
     score = service.calculate_trust_score(signals, red_flags)
@@ -326,19 +333,13 @@ def test_verification_status_boundary_80():
     assert score == 80
     
     # Status should be Verified (>= 80)
-    if score >= 80:
-        status = VerificationStatus.VERIFIED
-    elif score >= 50:
-        status = VerificationStatus.USE_CAUTION
-    else:
-        status = VerificationStatus.POTENTIAL_SCAM
+    status = service.determine_status(score)
     
     assert status == VerificationStatus.VERIFIED
 
 
-def test_verification_status_boundary_50():
+def test_verification_status_boundary_50(service):
     """Test verification status at boundary: trust_score = 50"""
-    service = VerificationService()
     from app.models.internship import VerificationSignals
     
     # Create signals that result in score of 50 (base score)
@@ -355,19 +356,13 @@ def test_verification_status_boundary_50():
     assert score == 50
     
     # Status should be Use Caution (>= 50)
-    if score >= 80:
-        status = VerificationStatus.VERIFIED
-    elif score >= 50:
-        status = VerificationStatus.USE_CAUTION
-    else:
-        status = VerificationStatus.POTENTIAL_SCAM
+    status = service.determine_status(score)
     
     assert status == VerificationStatus.USE_CAUTION
 
 
-def test_verification_status_boundary_79():
+def test_verification_status_boundary_79(service):
     """Test verification status at boundary: trust_score = 79"""
-    service = VerificationService()
     from app.models.internship import VerificationSignals
     
     # Create signals that result in score of 79
@@ -378,8 +373,8 @@ def test_verification_status_boundary_79():
     )
     # Base 50 + 20 + 20 + 10 = 100, need to subtract 21
     red_flags = [
-        RedFlag(type="test1", severity=RedFlagSeverity.HIGH, description="Test"),  # -20
-        RedFlag(type="test2", severity=RedFlagSeverity.LOW, description="Test")    # -5
+        _HIGH_FLAG,  # -20
+        _LOW_FLAG    # -5
     ]
     # 100 - 20 - 5 = 75, need to adjust
     
@@ -390,7 +385,7 @@ def test_verification_status_boundary_79():
         company_verified=False
     )
     red_flags = [
-        RedFlag(type="test", severity=RedFlagSeverity.MEDIUM, description="Test")  # -10
+        _MEDIUM_FLAG  # -10
     ]
     # 50 + 20 + 20 - 10 = 80, still not 79
     
@@ -401,8 +396,8 @@ def test_verification_status_boundary_79():
         company_verified=False
     )
     red_flags = [
-        RedFlag(type="test1", severity=RedFlagSeverity.MEDIUM, description="Test"),  # -10
-        RedFlag(type="test2", severity=RedFlagSeverity.LOW, description="Test")      # -5
+        _MEDIUM_FLAG,  # -10
+        _LOW_FLAG      # -5
     ]
     # 50 + 20 + 20 - 10 - 5 = 75
     
@@ -410,19 +405,13 @@ def test_verification_status_boundary_79():
     
     # Score should be 75 (close to 79, but exact 79 is hard to achieve with current scoring)
     # Status should be Use Caution (< 80)
-    if score >= 80:
-        status = VerificationStatus.VERIFIED
-    elif score >= 50:
-        status = VerificationStatus.USE_CAUTION
-    else:
-        status = VerificationStatus.POTENTIAL_SCAM
+    status = service.determine_status(score)
     
     assert status == VerificationStatus.USE_CAUTION
 
 
-def test_verification_status_boundary_49():
+def test_verification_status_boundary_49(service):
     """Test verification status at boundary: trust_score = 49"""
-    service = VerificationService()
     from app.models.internship import VerificationSignals
     
     # Create signals that result in score of 49
@@ -432,7 +421,7 @@ def test_verification_status_boundary_49():
         company_verified=False
     )
     red_flags = [
-        RedFlag(type="test", severity=RedFlagSeverity.LOW, description="Test")  # -5
+        _LOW_FLAG  # -5
     ]
     # 50 - 5 = 45
     
@@ -440,47 +429,34 @@ def test_verification_status_boundary_49():
     
     # Score should be 45 (close to 49)
     # Status should be Potential Scam (< 50)
-    if score >= 80:
-        status = VerificationStatus.VERIFIED
-    elif score >= 50:
-        status = VerificationStatus.USE_CAUTION
-    else:
-        status = VerificationStatus.POTENTIAL_SCAM
+    status = service.determine_status(score)
     
     assert status == VerificationStatus.POTENTIAL_SCAM
 
 
-def test_domain_verification_with_no_domain():
+def test_domain_verification_with_no_domain(service):
     """Test domain verification when no domain is provided"""
-    service = VerificationService()
-    
     result = service.check_domain_authenticity("Test Company", None)
     
     assert result is False
 
 
-def test_domain_verification_with_non_official_domain():
+def test_domain_verification_with_non_official_domain(service):
     """Test domain verification with non-official email domain"""
-    service = VerificationService()
-    
     result = service.check_domain_authenticity("Test Company", "gmail.com")
     
     assert result is False
 
 
-def test_platform_recognition_with_unknown_platform():
+def test_platform_recognition_with_unknown_platform(service):
     """Test platform recognition with unknown platform"""
-    service = VerificationService()
-    
     result = service.check_platform_legitimacy("UnknownPlatform123")
     
     assert result is False
 
 
-def test_red_flag_detection_with_multiple_flags():
+def test_red_flag_detection_with_multiple_flags(service):
     """Test red flag detection with multiple red flags present"""
-    service = VerificationService()
-    
     internship_data = {
         "title": "Software Intern - registration fee required",
         "company": "Test Company",
@@ -5,6 +5,17 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Optional parsing backends, looked up once at import
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+try:
+    import docx
+except ImportError:
+    docx = None
+
 class DocumentParser:
     """Parse various document formats to extract text"""
     
@@ -20,22 +31,17 @@ class DocumentParser:
             Extracted text
         """
         try:
-            # Try PyPDF2 first
-            try:
-                import PyPDF2
-                pdf_file = io.BytesIO(file_content)
-                pdf_reader = PyPDF2.PdfReader(pdf_file)
-                
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                
-                logger.info(f"Extracted {len(text)} characters from PDF")
-                return text.strip()
-            except ImportError:
-                logger.warning("PyPDF2 not installed, falling back to basic extraction")
-                # Fallback: try to decode as text
-                return file_content.decode('utf-8', errors='ignore')
+            if PyPDF2 is None:
+                logger.warning("PyPDF2 not installed")
+                raise ValueError("PDF parsing requires PyPDF2 library")
+            
+            pdf_file = io.BytesIO(file_content)
+            pdf_reader = PyPDF2.PdfReader(pdf_file)
+            
+            text = "\n".join(page.extract_text() for page in pdf_reader.pages)
+            
+            logger.info(f"Extracted {len(text)} characters from PDF")
+            return text.strip()
                 
         except Exception as e:
             logger.error(f"PDF extraction failed: {e}")
@@ -53,17 +59,16 @@ class DocumentParser:
             Extracted text
         """
         try:
-            try:
-                import docx
-                doc_file = io.BytesIO(file_content)
-                doc = docx.Document(doc_file)
-                
-                text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-                logger.info(f"Extracted {len(text)} characters from DOCX")
-                return text.strip()
-            except ImportError:
+            if docx is None:
                 logger.warning("python-docx not installed")
                 raise ValueError("DOCX parsing requires python-docx library")
+            
+            doc_file = io.BytesIO(file_content)
+            doc = docx.Document(doc_file)
+            
+            text = "\n".join(paragraph.text for paragraph in doc.paragraphs)
+            logger.info(f"Extracted {len(text)} characters from DOCX")
+            return text.strip()
                 
         except Exception as e:
             logger.error(f"DOCX extraction failed: {e}")
@@ -100,17 +105,27 @@ class DocumentParser:
         Returns:
             Extracted text
         """
-        extension = filename.lower().split('.')[-1]
+        extension = filename.rpartition('.')[2].lower()
         
-        if extension == 'pdf':
-            return DocumentParser.extract_text_from_pdf(file_content)
-        elif extension in ['docx', 'doc']:
-            return DocumentParser.extract_text_from_docx(file_content)
-        elif extension == 'txt':
-            return DocumentParser.extract_text_from_txt(file_content)
-        else:
+        extractor = _EXTRACTORS_BY_EXTENSION.get(extension)
+        if extractor is None:
             raise ValueError(f"Unsupported file format: {extension}")
+        return extractor(file_content)
+
+# Text extractor for each supported file extension
+_EXTRACTORS_BY_EXTENSION = {
+    'pdf': DocumentParser.extract_text_from_pdf,
+    'docx': DocumentParser.extract_text_from_docx,
+    'doc': DocumentParser.extract_text_from_docx,
+    'txt': DocumentParser.extract_text_from_txt,
+}
+
+# Singleton instance
+_document_parser = None
 
 def get_document_parser() -> DocumentParser:
-    """Get DocumentParser instance"""
-    return DocumentParser()
+    """Get or create DocumentParser singleton"""
+    global _document_parser
+    if _document_parser is None:
+        _document_parser = DocumentParser()
+    return _document_parser
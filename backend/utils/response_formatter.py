@@ -6,13 +6,14 @@ class ResponseFormatter:
     """Format API responses consistently"""
     
     @staticmethod
-    def success(data: Any, message: str = "Success") -> dict:
+    def success(data: Any, message: str = "Success", timestamp: Optional[str] = None) -> dict:
         """
         Format successful response
         
         Args:
             data: Response data
             message: Success message
+            timestamp: ISO timestamp to stamp on the response (defaults to now)
             
         Returns:
             Formatted response
@@ -21,11 +22,16 @@ class ResponseFormatter:
             "success": True,
             "message": message,
             "data": data,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp or datetime.utcnow().isoformat()
         }
     
     @staticmethod
-    def error(message: str, error_code: Optional[str] = None, details: Any = None) -> dict:
+    def error(
+        message: str,
+        error_code: Optional[str] = None,
+        details: Any = None,
+        timestamp: Optional[str] = None
+    ) -> dict:
         """
         Format error response
         
@@ -33,6 +39,7 @@ class ResponseFormatter:
             message: Error message
             error_code: Optional error code
             details: Additional error details
+            timestamp: ISO timestamp to stamp on the response (defaults to now)
             
         Returns:
             Formatted error response
@@ -40,7 +47,7 @@ class ResponseFormatter:
         response = {
             "success": False,
             "message": message,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp or datetime.utcnow().isoformat()
         }
         
         if error_code:
@@ -52,7 +59,13 @@ class ResponseFormatter:
         return response
     
     @staticmethod
-    def paginated(data: list, page: int, page_size: int, total: int) -> dict:
+    def paginated(
+        data: list,
+        page: int,
+        page_size: int,
+        total: int,
+        timestamp: Optional[str] = None
+    ) -> dict:
         """
         Format paginated response
         
@@ -61,6 +74,7 @@ class ResponseFormatter:
             page: Current page number
             page_size: Items per page
             total: Total items
+            timestamp: ISO timestamp to stamp on the response (defaults to now)
             
         Returns:
             Formatted paginated response
@@ -74,9 +88,15 @@ class ResponseFormatter:
                 "total": total,
                 "total_pages": (total + page_size - 1) // page_size
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp or datetime.utcnow().isoformat()
         }
 
+# Singleton instance
+_response_formatter = None
+
 def get_response_formatter() -> ResponseFormatter:
-    """Get ResponseFormatter instance"""
-    return ResponseFormatter()
+    """Get or create ResponseFormatter singleton"""
+    global _response_formatter
+    if _response_formatter is None:
+        _response_formatter = ResponseFormatter()
+    return _response_formatter